@@ -5,13 +5,41 @@ Converts Oracle functions and procedures to PostgreSQL compatible syntax
 import re
 import sqlparse
 from typing import Dict, List
+from dedup import strip_owner
 
 
 class OracleToPostgreSQLConverter:
     """Convert Oracle PL/SQL to PostgreSQL PL/pgSQL"""
     
-    def __init__(self):
+    # Identifiers that must stay quoted in PostgreSQL: reserved keywords
+    # and keywords that can be function or type names but not column names
+    PG_RESERVED_WORDS = {
+        'all', 'analyse', 'analyze', 'and', 'any', 'array', 'as', 'asc',
+        'asymmetric', 'both', 'case', 'cast', 'check', 'collate', 'column',
+        'constraint', 'create', 'current_catalog', 'current_date',
+        'current_role', 'current_time', 'current_timestamp', 'current_user',
+        'default', 'deferrable', 'desc', 'distinct', 'do', 'else', 'end',
+        'except', 'false', 'fetch', 'for', 'foreign', 'from', 'grant',
+        'group', 'having', 'in', 'initially', 'intersect', 'into', 'lateral',
+        'leading', 'limit', 'localtime', 'localtimestamp', 'not', 'null',
+        'offset', 'on', 'only', 'or', 'order', 'placing', 'primary',
+        'references', 'returning', 'select', 'session_user', 'some',
+        'symmetric', 'table', 'then', 'to', 'trailing', 'true', 'union',
+        'unique', 'user', 'using', 'variadic', 'when', 'where', 'window',
+        'with',
+        'authorization', 'binary', 'collation', 'concurrently', 'cross',
+        'current_schema', 'freeze', 'full', 'ilike', 'inner', 'is', 'isnull',
+        'join', 'left', 'like', 'natural', 'notnull', 'outer', 'overlaps',
+        'right', 'similar', 'tablesample', 'verbose',
+    }
+    
+    def __init__(self, metrics=None):
+        """
+        Args:
+            metrics: Optional MigrationMetrics used to time the format phase
+        """
         self.conversion_log = []
+        self.metrics = metrics
     
     def convert_procedure(self, oracle_code: str) -> str:
         """
@@ -41,7 +69,11 @@ class OracleToPostgreSQLConverter:
         converted = self._convert_sequences(converted)
         converted = self._convert_dual_table(converted)
         converted = self._convert_rownum(converted)
-        converted = self._format_code(converted)
+        if self.metrics:
+            with self.metrics.time('format'):
+                converted = self._format_code(converted)
+        else:
+            converted = self._format_code(converted)
         
         # Log converted
         self.conversion_log.append("\n=== Converted PostgreSQL Code ===")
@@ -49,6 +81,190 @@ class OracleToPostgreSQLConverter:
         
         return converted
     
+    def convert_ddl(self, oracle_ddl: str, owner: str = None) -> str:
+        """
+        Convert Oracle DDL (as produced by DBMS_METADATA) to PostgreSQL
+        
+        Args:
+            oracle_ddl: Oracle CREATE/ALTER statement
+            owner: Oracle schema owner whose qualifiers should be removed
+            
+        Returns:
+            PostgreSQL DDL statement
+        """
+        converted = oracle_ddl.strip()
+        
+        # Log original
+        self.conversion_log.append("=== Original Oracle DDL ===")
+        self.conversion_log.append(oracle_ddl)
+        
+        # String literals are kept out of every rule, so that a value
+        # such as 'DATE' in a CHECK or DEFAULT is not rewritten
+        literals = []
+        
+        def _protect_literal(match):
+            if not match.group(0).startswith("'"):
+                return match.group(0)
+            literals.append(match.group(0))
+            return f"__QLIT{len(literals) - 1}__"
+        
+        converted = re.sub(r"'(?:[^']|'')*'|\"[^\"]*\"", _protect_literal, converted)
+        
+        # Apply conversions
+        if owner:
+            converted = strip_owner(converted, owner)
+        converted = self._convert_ddl_clauses(converted)
+        
+        # Quoted identifiers are kept out of the rules below, so that
+        # a column named "DATE" is not taken for a data type
+        identifiers = []
+        
+        def _protect(match):
+            identifiers.append(match.group(0))
+            return f"__QID{len(identifiers) - 1}__"
+        
+        converted = re.sub(r'"[^"]*"', _protect, converted)
+        converted = self._convert_data_types(converted)
+        converted = self._convert_string_functions(converted)
+        converted = self._convert_date_functions(converted)
+        converted = self._convert_null_functions(converted)
+        converted = self._convert_sequences(converted)
+        converted = self._convert_dual_table(converted)
+        converted = self._convert_rownum(converted)
+        converted = re.sub(
+            r'__QID(\d+)__',
+            lambda match: self._convert_quoted_identifier(identifiers[int(match.group(1))]),
+            converted
+        )
+        if re.search(r'\bROWNUM\b', converted, re.IGNORECASE):
+            self.conversion_log.append("WARNING: ROWNUM predicate needs manual conversion")
+        converted = re.sub(
+            r'__QLIT(\d+)__',
+            lambda match: literals[int(match.group(1))],
+            converted
+        )
+        
+        converted = converted.rstrip().rstrip('/').rstrip()
+        if not converted.endswith(';'):
+            converted += ';'
+        
+        # Log converted
+        self.conversion_log.append("\n=== Converted PostgreSQL DDL ===")
+        self.conversion_log.append(converted)
+        
+        return converted
+    
+    def _convert_ddl_clauses(self, code: str) -> str:
+        """
+        Remove or convert Oracle-only DDL clauses
+        
+        Clauses are only looked for outside parentheses, where DBMS_METADATA
+        puts them, so that column lists, CHECK conditions and expressions
+        are left alone. The query of a view is never touched.
+        """
+        # "SEQ"."NEXTVAL" -> "SEQ".NEXTVAL, handled by _convert_sequences
+        code = re.sub(r'\."(NEXTVAL|CURRVAL)"', r'.\1', code, flags=re.IGNORECASE)
+        
+        view = re.match(
+            r'\s*CREATE\b(?:"[^"]*"|[^"])*?\bVIEW\b(?:"[^"]*"|[^"])*?\bAS\b',
+            code, re.IGNORECASE | re.DOTALL
+        )
+        if view:
+            return (self._convert_clauses_outside_parentheses(code[:view.end()]) +
+                    self._convert_view_query(code[view.end():]))
+        
+        # Inline column attributes
+        code = re.sub(r'\b(NOT\s+NULL|NULL)\s+ENABLE\b', r'\1', code, flags=re.IGNORECASE)
+        code = re.sub(r'\s+COLLATE\s+"USING_NLS_COMP"', '', code, flags=re.IGNORECASE)
+        
+        return self._convert_clauses_outside_parentheses(code)
+    
+    def _convert_clauses_outside_parentheses(self, code: str) -> str:
+        """Convert the clauses of a statement, leaving parenthesized parts alone"""
+        groups = []
+        
+        def _protect(group):
+            groups.append(group)
+            return f"__PAREN{len(groups) - 1}__"
+        
+        code = self._replace_parenthesized(code, _protect)
+        
+        if re.search(r'\bDISABLE\b', code, re.IGNORECASE):
+            self.conversion_log.append("WARNING: Disabled constraint needs manual review")
+        if re.search(r'\bCREATE\s+BITMAP\s+INDEX\b', code, re.IGNORECASE):
+            self.conversion_log.append("WARNING: Bitmap index converted to a B-tree index")
+        
+        conversions = {
+            # Constraint state
+            r'\s+USING\s+INDEX(?=\s+ENABLE\b|\s*;|\s*$)': '',
+            r'\s+ENABLE\s+NOVALIDATE\b': ' NOT VALID',
+            r'\s+ENABLE(?:\s+VALIDATE)?\b': '',
+            # Index types PostgreSQL does not have
+            r'\bCREATE\s+BITMAP\s+INDEX\b': 'CREATE INDEX',
+            # Views
+            r'\bFORCE\s+(?=(?:NON)?EDITIONABLE\b|EDITIONING\b|VIEW\b)': '',
+            r'\b(?:NON)?EDITIONABLE\s+': '',
+            r'\bEDITIONING\s+': '',
+            # Physical attributes left over by DBMS_METADATA transforms
+            r'\s+SEGMENT\s+CREATION\s+(?:IMMEDIATE|DEFERRED)\b': '',
+            r'\s+(?:DEFAULT\s+COLLATION|COLLATE)\s+"?USING_NLS_COMP"?': '',
+            r'\s+(?:NOCOMPRESS|NOLOGGING|LOGGING|NOPARALLEL)\b': '',
+            r'\s+PCT(?:FREE|USED)\s+\d+': '',
+            r'\s+INITRANS\s+\d+': '',
+            r'\s+MAXTRANS\s+\d+': '',
+        }
+        
+        for oracle_clause, pg_clause in conversions.items():
+            code = re.sub(oracle_clause, pg_clause, code, flags=re.IGNORECASE)
+        
+        return re.sub(r'__PAREN(\d+)__', lambda match: groups[int(match.group(1))], code)
+    
+    def _convert_view_query(self, query: str) -> str:
+        """Convert the options after the query of a view"""
+        if re.search(r'\bWITH\s+READ\s+ONLY\b', query, re.IGNORECASE):
+            self.conversion_log.append(
+                "WARNING: WITH READ ONLY removed, revoke write privileges on the view instead"
+            )
+            query = re.sub(
+                r'\s+WITH\s+READ\s+ONLY(?:\s+CONSTRAINT\s+(?:"[^"]*"|\w+))?(?=\s*;?\s*$)',
+                '', query, flags=re.IGNORECASE
+            )
+        # PostgreSQL does not name the check option
+        return re.sub(
+            r'(\bWITH\s+CHECK\s+OPTION)\s+CONSTRAINT\s+(?:"[^"]*"|\w+)(?=\s*;?\s*$)',
+            r'\1', query, flags=re.IGNORECASE
+        )
+    
+    @staticmethod
+    def _replace_parenthesized(code: str, replace) -> str:
+        """Replace every outermost parenthesized part of code with replace(part)"""
+        parts = []
+        depth = 0
+        start = 0
+        for index, char in enumerate(code):
+            if char == '(':
+                if depth == 0:
+                    parts.append(code[start:index])
+                    start = index
+                depth += 1
+            elif char == ')' and depth:
+                depth -= 1
+                if depth == 0:
+                    parts.append(replace(code[start:index + 1]))
+                    start = index + 1
+        parts.append(code[start:])
+        return ''.join(parts)
+    
+    def _convert_quoted_identifier(self, identifier: str) -> str:
+        """Unquote an uppercase identifier so PostgreSQL folds it to lowercase"""
+        if not re.fullmatch(r'"[A-Z][A-Z0-9_$#]*"', identifier):
+            return identifier
+        name = identifier[1:-1].lower()
+        # '#' is not allowed in unquoted PostgreSQL identifiers
+        if name in self.PG_RESERVED_WORDS or '#' in name:
+            return f'"{name}"'
+        return name
+    
     def _convert_create_statement(self, code: str) -> str:
         """Convert CREATE PROCEDURE/FUNCTION syntax"""
         # Oracle: CREATE OR REPLACE PROCEDURE proc_name
@@ -92,17 +308,34 @@ class OracleToPostgreSQLConverter:
     
     def _convert_data_types(self, code: str) -> str:
         """Convert Oracle data types to PostgreSQL equivalents"""
+        # Drop BYTE/CHAR length semantics: VARCHAR2(50 BYTE) -> VARCHAR2(50)
+        code = re.sub(
+            r'\b(N?VARCHAR2|N?CHAR)\s*\(\s*(\d+)\s+(?:BYTE|CHAR)\s*\)',
+            r'\1(\2)',
+            code,
+            flags=re.IGNORECASE
+        )
+        
         conversions = {
+            r'\bNUMBER\s*\(\s*\*': 'NUMERIC(38',
             r'\bNUMBER\b': 'NUMERIC',
-            r'\bVARCHAR2\b': 'VARCHAR',
-            r'\bCLOB\b': 'TEXT',
+            r'\bFLOAT\s*\(\s*\d+\s*\)': 'DOUBLE PRECISION',
+            r'\bN?VARCHAR2\b': 'VARCHAR',
+            r'\bNCHAR\b': 'CHAR',
+            r'\bN?CLOB\b': 'TEXT',
             r'\bBLOB\b': 'BYTEA',
+            r'\bTIMESTAMP\s*(\(\s*\d\s*\))?\s+WITH\s+LOCAL\s+TIME\s+ZONE\b': r'TIMESTAMP\1 WITH TIME ZONE',
             r'\bDATE\b': 'TIMESTAMP',
+            r'\bLONG\s+RAW\b': 'BYTEA',
             r'\bRAW\b': 'BYTEA',
             r'\bLONG\b': 'TEXT',
             r'\bINTEGER\b': 'INTEGER',
             r'\bBINARY_INTEGER\b': 'INTEGER',
             r'\bPLS_INTEGER\b': 'INTEGER',
+            r'\bSIMPLE_INTEGER\b': 'INTEGER',
+            r'\bBINARY_FLOAT\b': 'REAL',
+            r'\bBINARY_DOUBLE\b': 'DOUBLE PRECISION',
+            r'\bXMLTYPE\b': 'XML',
         }
         
         for oracle_type, pg_type in conversions.items():
@@ -110,6 +343,10 @@ class OracleToPostgreSQLConverter:
         
         return code
     
+    def convert_data_type(self, oracle_type: str) -> str:
+        """Get the PostgreSQL equivalent of a single Oracle data type"""
+        return self._convert_data_types(oracle_type)
+    
     def _convert_variable_declarations(self, code: str) -> str:
         """Convert variable declaration syntax"""
         # Oracle: var_name TYPE := value;
@@ -203,25 +440,67 @@ class OracleToPostgreSQLConverter:
     
     def _convert_sequences(self, code: str) -> str:
         """Convert sequence syntax"""
-        # Oracle: seq_name.NEXTVAL
-        # PostgreSQL: NEXTVAL('seq_name')
+        # Oracle: [schema.]seq_name.NEXTVAL
+        # PostgreSQL: NEXTVAL('[schema.]seq_name')
         
         code = re.sub(
-            r'(\w+)\.NEXTVAL',
+            r'((?:\w+\.)?\w+)\.NEXTVAL',
             r"NEXTVAL('\1')",
             code,
             flags=re.IGNORECASE
         )
         
         code = re.sub(
-            r'(\w+)\.CURRVAL',
+            r'((?:\w+\.)?\w+)\.CURRVAL',
             r"CURRVAL('\1')",
             code,
             flags=re.IGNORECASE
         )
         
+        # CREATE SEQUENCE options
+        code = re.sub(
+            r'CREATE\s+SEQUENCE\b[^;]*',
+            lambda match: self._convert_sequence_options(match.group(0)),
+            code,
+            flags=re.IGNORECASE
+        )
+        
         return code
     
+    def _convert_sequence_options(self, statement: str) -> str:
+        """Convert the options of a CREATE SEQUENCE statement"""
+        conversions = {
+            r'\bNOCYCLE\b': 'NO CYCLE',
+            r'\bNOMAXVALUE\b': 'NO MAXVALUE',
+            r'\bNOMINVALUE\b': 'NO MINVALUE',
+            # Options without a PostgreSQL equivalent
+            r'\s+(?:NO)?ORDER\b': '',
+            r'\s+NOCACHE\b': '',
+            r'\s+(?:NO)?KEEP\b': '',
+            r'\s+(?:NO)?SCALE\b(?:\s+(?:NO)?EXTEND\b)?': '',
+            r'\s+(?:NO)?SHARD\b(?:\s+(?:NO)?EXTEND\b)?': '',
+            r'\s+(?:GLOBAL|SESSION)\b': '',
+        }
+        
+        for oracle_option, pg_option in conversions.items():
+            statement = re.sub(oracle_option, pg_option, statement, flags=re.IGNORECASE)
+        
+        # Oracle's default bounds exceed the range of PostgreSQL's bigint
+        def _bound(match):
+            if abs(int(match.group(2))) > 9223372036854775807:
+                self.conversion_log.append(f"Removed out of range {match.group(1).upper()}")
+                return ''
+            return match.group(0)
+        
+        statement = re.sub(
+            r'\s+(MAXVALUE|MINVALUE)\s+(-?\d+)',
+            _bound,
+            statement,
+            flags=re.IGNORECASE
+        )
+        
+        return statement
+    
     def _convert_dual_table(self, code: str) -> str:
         """Convert DUAL table references"""
         # Oracle: SELECT ... FROM DUAL
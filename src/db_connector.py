@@ -2,14 +2,78 @@
 Database connection utilities for PostgreSQL and Oracle
 """
 import os
+import re
+from decimal import Decimal
 import cx_Oracle
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Object types extracted by OracleConnector.iter_ddl, in creation order
+DDL_OBJECT_TYPES = ('SEQUENCE', 'TABLE', 'CONSTRAINT', 'INDEX', 'REF_CONSTRAINT', 'VIEW')
+
+# Catalog queries returning (name, ddl) for each DDL object type
+DDL_QUERIES = {
+    'SEQUENCE': """
+        SELECT sequence_name,
+               DBMS_METADATA.GET_DDL('SEQUENCE', sequence_name, sequence_owner)
+        FROM all_sequences
+        WHERE sequence_owner = :owner
+        ORDER BY sequence_name
+    """,
+    'TABLE': """
+        SELECT table_name,
+               DBMS_METADATA.GET_DDL('TABLE', table_name, owner)
+        FROM all_tables
+        WHERE owner = :owner
+          AND nested = 'NO'
+          AND secondary = 'N'
+          AND dropped = 'NO'
+          AND (iot_type IS NULL OR iot_type = 'IOT')
+        ORDER BY table_name
+    """,
+    # The CONSTRAINTS transform removes every check from the table DDL but
+    # the NOT NULL ones, so all other checks are extracted, named or not
+    'CONSTRAINT': """
+        SELECT constraint_name,
+               DBMS_METADATA.GET_DDL('CONSTRAINT', constraint_name, owner)
+        FROM all_constraints
+        WHERE owner = :owner
+          AND (constraint_type IN ('P', 'U')
+               OR (constraint_type = 'C'
+                   AND NOT REGEXP_LIKE(search_condition_vc, '^"[^"]+" IS NOT NULL$')))
+          AND table_name IN (SELECT table_name FROM all_tables WHERE owner = :owner)
+        ORDER BY table_name, constraint_name
+    """,
+    # Indexes backing constraints are created by the constraints themselves
+    'INDEX': """
+        SELECT i.index_name,
+               DBMS_METADATA.GET_DDL('INDEX', i.index_name, i.owner)
+        FROM all_indexes i
+        WHERE i.owner = :owner
+          AND i.generated = 'N'
+          AND i.index_type NOT IN ('LOB', 'IOT - TOP')
+          AND NOT EXISTS (
+              SELECT 1 FROM all_constraints c
+              WHERE c.owner = i.table_owner
+                AND c.index_name = i.index_name
+          )
+        ORDER BY i.table_name, i.index_name
+    """,
+    'REF_CONSTRAINT': """
+        SELECT constraint_name,
+               DBMS_METADATA.GET_DDL('REF_CONSTRAINT', constraint_name, owner)
+        FROM all_constraints
+        WHERE owner = :owner
+          AND constraint_type = 'R'
+        ORDER BY table_name, constraint_name
+    """,
+}
+
 
 class PostgreSQLConnector:
     """PostgreSQL database connector"""
@@ -79,6 +143,108 @@ class PostgreSQLConnector:
             self.connection.rollback()
             print(f"✗ Script execution error: {e}")
             return False
+    
+    def get_sequences(self, schema=None):
+        """
+        Get the current state of all sequences
+        
+        pg_sequences.last_value is NULL until nextval() has been called
+        after a setval(..., false), so last_value and is_called are read
+        from the sequence relations themselves, all in one query.
+        
+        Returns:
+            List of dicts with schemaname, sequencename, min_value,
+            max_value, increment_by, last_value and is_called
+        """
+        query = """
+            SELECT schemaname, sequencename, min_value, max_value, increment_by
+            FROM pg_sequences
+        """
+        params = None
+        if schema:
+            query += " WHERE schemaname = %s"
+            params = (schema,)
+        query += " ORDER BY schemaname, sequencename"
+        sequences = self.execute_query(query, params)
+        if not sequences:
+            return sequences
+        
+        states = self.execute_query(sql.SQL("\nUNION ALL\n").join(
+            sql.SQL("SELECT {} AS i, last_value, is_called FROM {}").format(
+                sql.Literal(i), sql.Identifier(row['schemaname'], row['sequencename'])
+            )
+            for i, row in enumerate(sequences)
+        ))
+        if states is None:
+            return None
+        
+        for state in states:
+            sequences[state['i']].update(
+                last_value=state['last_value'], is_called=state['is_called']
+            )
+        return sequences
+    
+    def set_sequence_values(self, values):
+        """
+        Set the next value of many sequences in a single round trip
+        
+        Args:
+            values: List of (qualified sequence name, next value) tuples
+        """
+        if not values:
+            return True
+        statement = ';\n'.join(["SELECT setval(%s, %s, false)"] * len(values))
+        params = [param for value in values for param in value]
+        return self.execute_command(statement, params)
+    
+    def call_function_batch(self, name, rows, arg_types):
+        """
+        Call a function for many input tuples in one round trip
+        
+        The calls are never committed. If one input raises an error the
+        batch is retried one input at a time to find out which.
+        
+        Args:
+            name: Function name, optionally schema qualified
+            rows: Input tuples
+            arg_types: PostgreSQL type of each argument
+            
+        Returns:
+            List of (ok, result or error message) in input order
+        """
+        if not rows:
+            return []
+        
+        args = ', '.join(f"t.a{j}" for j in range(len(arg_types)))
+        columns = ''.join(f", a{j}" for j in range(len(arg_types)))
+        query = f"SELECT t.i, {name}({args}) AS r FROM (VALUES %s) AS t(i{columns})"
+        template = '(' + ', '.join(['%s'] + [f"%s::{arg_type}" for arg_type in arg_types]) + ')'
+        
+        try:
+            try:
+                results = execute_values(
+                    self.cursor, query,
+                    [(i,) + tuple(row) for i, row in enumerate(rows)],
+                    template=template, page_size=len(rows), fetch=True
+                )
+                by_index = {row['i']: row['r'] for row in results}
+                return [(True, by_index[i]) for i in range(len(rows))]
+            except psycopg2.Error:
+                self.connection.rollback()
+            
+            single = f"SELECT {name}(" + ', '.join(f"%s::{arg_type}" for arg_type in arg_types) + ") AS r"
+            results = []
+            for row in rows:
+                try:
+                    self.cursor.execute(single, row)
+                    results.append((True, self.cursor.fetchone()['r']))
+                except psycopg2.Error as e:
+                    self.connection.rollback()
+                    results.append((False, str(e).strip()))
+            return results
+        finally:
+            # Never keep side effects of the calls
+            self.connection.rollback()
 
 
 class OracleConnector:
@@ -92,6 +258,8 @@ class OracleConnector:
         self.password = os.getenv('ORACLE_PASSWORD')
         self.connection = None
         self.cursor = None
+        # (object_type, object_name, error) of the objects iter_ddl() could not extract
+        self.ddl_errors = []
     
     def connect(self):
         """Establish connection to Oracle"""
@@ -146,17 +314,116 @@ class OracleConnector:
             return False
     
     def get_procedures(self, owner=None):
-        """Get list of procedures from Oracle"""
+        """
+        Get list of procedures from Oracle
+        
+        LAST_DDL_TIME is the latest of the object and, for packages, of
+        the package body, so it changes whenever the source does.
+        """
         query = """
-            SELECT object_name, object_type, status
-            FROM all_objects
-            WHERE object_type IN ('PROCEDURE', 'FUNCTION', 'PACKAGE')
+            SELECT o.owner, o.object_name, o.object_type, o.status,
+                   (SELECT MAX(b.last_ddl_time)
+                    FROM all_objects b
+                    WHERE b.owner = o.owner
+                      AND b.object_name = o.object_name
+                      AND b.object_type LIKE o.object_type || '%') AS last_ddl_time
+            FROM all_objects o
+            WHERE o.object_type IN ('PROCEDURE', 'FUNCTION', 'PACKAGE')
         """
         if owner:
-            query += f" AND owner = '{owner}'"
-        query += " ORDER BY object_name"
+            query += f" AND o.owner = '{owner}'"
+        query += " ORDER BY o.object_name, o.owner"
         return self.execute_query(query)
     
+    def get_sequences(self, owner=None):
+        """Get the next value of all sequences in a single round trip"""
+        query = """
+            SELECT sequence_owner, sequence_name, last_number, increment_by
+            FROM all_sequences
+        """
+        params = None
+        if owner:
+            query += " WHERE sequence_owner = :owner"
+            params = {'owner': owner}
+        query += " ORDER BY sequence_owner, sequence_name"
+        
+        self.cursor.arraysize = 1000
+        return self.execute_query(query, params)
+    
+    def get_function_arguments(self, name, owner=None):
+        """
+        Get the arguments of a standalone function, return value first
+        
+        Without an owner, the arguments of the functions of that name in
+        all schemas are returned, so callers must check the OWNER column.
+        """
+        query = """
+            SELECT owner, argument_name, position, data_type, in_out
+            FROM all_arguments
+            WHERE object_name = :name
+              AND package_name IS NULL
+              AND data_level = 0
+        """
+        params = {'name': name}
+        if owner:
+            query += " AND owner = :owner"
+            params['owner'] = owner
+        query += " ORDER BY owner, position"
+        return self.execute_query(query, params)
+    
+    def call_function_batch(self, name, rows):
+        """
+        Call a function for many input tuples in one round trip
+        
+        The calls of a batch are combined with UNION ALL so batches of the
+        same size share one statement in the connection's statement cache.
+        If one input raises an error the batch is retried one input at a
+        time with a prepared statement to find out which.
+        
+        Args:
+            name: Function name, optionally owner qualified
+            rows: Input tuples
+            
+        Returns:
+            List of (ok, result or error message) in input order
+        """
+        if not rows:
+            return []
+        
+        selects = []
+        params = {}
+        for i, row in enumerate(rows):
+            binds = []
+            for j, value in enumerate(row):
+                params[f"a{i}_{j}"] = value
+                binds.append(f":a{i}_{j}")
+            selects.append(f"SELECT {i} AS i, {name}({', '.join(binds)}) AS r FROM dual")
+        
+        cursor = self.connection.cursor()
+        cursor.outputtypehandler = _number_as_decimal
+        try:
+            try:
+                cursor.execute("\nUNION ALL\n".join(selects), params)
+                by_index = {int(i): value for i, value in cursor.fetchall()}
+                return [(True, by_index[i]) for i in range(len(rows))]
+            except cx_Oracle.DatabaseError:
+                pass
+            
+            binds = ', '.join(f":{j + 1}" for j in range(len(rows[0])))
+            cursor.prepare(f"SELECT {name}({binds}) FROM dual")
+            results = []
+            for row in rows:
+                try:
+                    cursor.execute(None, list(row))
+                    results.append((True, cursor.fetchone()[0]))
+                except cx_Oracle.DatabaseError as e:
+                    results.append((False, str(e).strip()))
+            return results
+        finally:
+            cursor.close()
+            # Never keep side effects of the calls
+            self.connection.rollback()
+    
     def get_procedure_source(self, name, owner=None):
         """Get source code of a procedure/function"""
         query = """
@@ -175,6 +442,230 @@ class OracleConnector:
         if results:
             return ''.join([row['TEXT'] for row in results])
         return None
+    
+    def get_procedure_sources(self, owner=None, names=None):
+        """
+        Get source code of many procedures/functions in a single round trip
+        
+        Args:
+            owner: Oracle schema owner (optional, all schemas if omitted)
+            names: Object names to fetch (optional, all objects if omitted).
+                Oracle allows at most 1000 names in an IN list, so longer
+                lists are fetched with one query per 1000 names.
+            
+        Returns:
+            Dict mapping (owner, name) to source code, or None on error
+        """
+        query = """
+            SELECT owner, name, text
+            FROM all_source
+            WHERE type IN ('PROCEDURE', 'FUNCTION', 'PACKAGE', 'PACKAGE BODY')
+        """
+        params = {}
+        if owner:
+            query += " AND owner = :owner"
+            params['owner'] = owner
+        
+        if names:
+            chunks = [names[start:start + 1000] for start in range(0, len(names), 1000)]
+        else:
+            chunks = [None]
+        
+        # Fetch many lines per round trip instead of the driver default
+        self.cursor.arraysize = 1000
+        
+        sources = {}
+        for chunk in chunks:
+            chunk_query = query
+            chunk_params = dict(params)
+            if chunk:
+                binds = [f":name{i}" for i in range(len(chunk))]
+                chunk_query += f" AND name IN ({', '.join(binds)})"
+                chunk_params.update({f"name{i}": name for i, name in enumerate(chunk)})
+            chunk_query += " ORDER BY owner, name, type, line"
+            
+            results = self.execute_query(chunk_query, chunk_params)
+            if results is None:
+                return None
+            
+            for row in results:
+                key = (row['OWNER'], row['NAME'])
+                sources.setdefault(key, []).append(row['TEXT'])
+        return {key: ''.join(lines) for key, lines in sources.items()}
+    
+    def _set_ddl_transforms(self):
+        """Configure DBMS_METADATA to leave out physical attributes"""
+        self.cursor.execute("""
+            BEGIN
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'STORAGE', FALSE);
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SEGMENT_ATTRIBUTES', FALSE);
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'TABLESPACE', FALSE);
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'CONSTRAINTS', FALSE);
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'REF_CONSTRAINTS', FALSE);
+                DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SQLTERMINATOR', TRUE);
+            END;
+        """)
+    
+    def _get_view_order(self, owner):
+        """Get view names of a schema, each after the views it depends on"""
+        self.cursor.execute("""
+            SELECT v.view_name, d.referenced_name
+            FROM all_views v
+            LEFT JOIN all_dependencies d
+              ON d.owner = v.owner
+             AND d.name = v.view_name
+             AND d.type = 'VIEW'
+             AND d.referenced_owner = v.owner
+             AND d.referenced_type = 'VIEW'
+            WHERE v.owner = :owner
+            ORDER BY v.view_name
+        """, owner=owner)
+        
+        depends_on = {}
+        for view_name, referenced_name in self.cursor:
+            references = depends_on.setdefault(view_name, set())
+            if referenced_name:
+                references.add(referenced_name)
+        
+        ordered = []
+        visited = set()
+        
+        def visit(name):
+            if name in visited or name not in depends_on:
+                return
+            visited.add(name)
+            for referenced_name in sorted(depends_on[name]):
+                visit(referenced_name)
+            ordered.append(name)
+        
+        for name in depends_on:
+            visit(name)
+        return ordered
+    
+    def iter_ddl(self, owner, object_types=DDL_OBJECT_TYPES, batch_size=500):
+        """
+        Stream the DDL of a schema with DBMS_METADATA.GET_DDL
+        
+        The DDL is generated over one catalog cursor per object type and
+        fetched batch_size rows per round trip, so memory use does not
+        grow with the size of the schema.
+        If GET_DDL fails for an object type, the rest of that type is
+        extracted one object at a time and the objects that still fail
+        are recorded in ddl_errors.
+        
+        Args:
+            owner: Oracle schema owner
+            object_types: Object types to extract, in output order
+            batch_size: Number of objects fetched per round trip
+            
+        Yields:
+            Tuples of (object_type, object_name, ddl)
+        """
+        self._set_ddl_transforms()
+        self.ddl_errors = []
+        
+        cursor = self._ddl_cursor(batch_size)
+        try:
+            for object_type in object_types:
+                if object_type == 'VIEW':
+                    yield from self._iter_view_ddl(cursor, owner, batch_size)
+                    continue
+                
+                extracted = set()
+                try:
+                    cursor.execute(DDL_QUERIES[object_type], owner=owner)
+                    while True:
+                        rows = cursor.fetchmany()
+                        if not rows:
+                            break
+                        for name, ddl in rows:
+                            extracted.add(name)
+                            yield object_type, name, ddl
+                except cx_Oracle.DatabaseError as e:
+                    # A single object GET_DDL cannot handle ends the whole
+                    # query, so the rest of the type is extracted one by one
+                    print(f"✗ {object_type} DDL extraction failed, retrying per object: {e}")
+                    cursor.close()
+                    cursor = self._ddl_cursor(batch_size)
+                    try:
+                        cursor.execute(_ddl_names_query(object_type), owner=owner)
+                        names = [row[0] for row in cursor.fetchall()]
+                    except cx_Oracle.DatabaseError as e:
+                        print(f"✗ Failed to list {object_type} objects: {e}")
+                        self.ddl_errors.append((object_type, None, str(e).strip()))
+                        continue
+                    yield from self._iter_object_ddl(
+                        cursor, owner, object_type,
+                        [name for name in names if name not in extracted]
+                    )
+        finally:
+            cursor.close()
+    
+    def _ddl_cursor(self, batch_size):
+        """Open a cursor fetching GET_DDL results as strings"""
+        cursor = self.connection.cursor()
+        cursor.arraysize = batch_size
+        cursor.outputtypehandler = _clob_as_string
+        return cursor
+    
+    def _iter_object_ddl(self, cursor, owner, object_type, names):
+        """Stream DDL one object per query, recording the objects that fail"""
+        for name in names:
+            try:
+                cursor.execute(
+                    "SELECT DBMS_METADATA.GET_DDL(:object_type, :name, :owner) FROM dual",
+                    object_type=object_type, name=name, owner=owner
+                )
+                ddl = cursor.fetchone()[0]
+            except cx_Oracle.DatabaseError as e:
+                print(f"✗ {object_type} {name}: {e}")
+                self.ddl_errors.append((object_type, name, str(e).strip()))
+                continue
+            yield object_type, name, ddl
+    
+    def _iter_view_ddl(self, cursor, owner, batch_size):
+        """Stream view DDL in dependency order"""
+        names = self._get_view_order(owner)
+        # Oracle allows at most 1000 expressions in an IN list
+        batch_size = min(batch_size, 1000)
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            binds = [f":name{i}" for i in range(len(batch))]
+            params = {f"name{i}": name for i, name in enumerate(batch)}
+            params['owner'] = owner
+            try:
+                cursor.execute(f"""
+                    SELECT view_name,
+                           DBMS_METADATA.GET_DDL('VIEW', view_name, owner)
+                    FROM all_views
+                    WHERE owner = :owner
+                      AND view_name IN ({', '.join(binds)})
+                """, params)
+                ddl_by_name = dict(cursor.fetchall())
+            except cx_Oracle.DatabaseError as e:
+                print(f"✗ VIEW DDL extraction failed, retrying per object: {e}")
+                yield from self._iter_object_ddl(cursor, owner, 'VIEW', batch)
+                continue
+            for name in batch:
+                if name in ddl_by_name:
+                    yield 'VIEW', name, ddl_by_name[name]
+
+
+def _ddl_names_query(object_type):
+    """Get the catalog query of an object type without the GET_DDL column"""
+    return re.sub(r',\s*DBMS_METADATA\.GET_DDL\([^)]*\)', '', DDL_QUERIES[object_type])
+
+
+def _number_as_decimal(cursor, name, default_type, size, precision, scale):
+    """Fetch NUMBER columns as Decimal so no precision is lost"""
+    if default_type == cx_Oracle.DB_TYPE_NUMBER:
+        return cursor.var(Decimal, arraysize=cursor.arraysize)
+
+
+def _clob_as_string(cursor, name, default_type, size, precision, scale):
+    """Fetch CLOB columns as strings instead of LOB locators"""
+    if default_type == cx_Oracle.DB_TYPE_CLOB:
+        return cursor.var(cx_Oracle.DB_TYPE_LONG, arraysize=cursor.arraysize)
 
 
 def test_connections():
@@ -0,0 +1,172 @@
+"""
+Deduplication of identical procedures/functions across schemas
+Groups objects whose normalized source is identical so each distinct body
+is converted only once
+"""
+import hashlib
+import re
+from typing import Dict, List
+
+# Comments, string literals and quoted identifiers are kept verbatim
+_VERBATIM_PATTERN = re.compile(
+    r"(--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"[^\"]*\")",
+    re.DOTALL
+)
+
+
+# Stands in for the schema owner in code converted once for many schemas
+OWNER_PLACEHOLDER = '__DEDUP_OWNER__'
+
+_OBJECT_NAME_PATTERN = re.compile(
+    r'^(\s*(?:CREATE\s+(?:OR\s+REPLACE\s+)?)?(?:(?:NON)?EDITIONABLE\s+)?'
+    r'(?:PROCEDURE|FUNCTION|PACKAGE(?:\s+BODY)?)\s+)',
+    re.IGNORECASE
+)
+
+
+def strip_owner(source: str, owner: str) -> str:
+    """
+    Remove schema owner qualifiers from source code
+
+    Args:
+        source: Oracle PL/SQL code
+        owner: Oracle schema owner whose qualifiers should be removed
+
+    Returns:
+        Source code with OWNER. and "OWNER". prefixes removed
+    """
+    return replace_owner(source, owner, None)
+
+
+def replace_owner(source: str, owner: str, new_owner: str) -> str:
+    """
+    Replace schema owner qualifiers in source code
+
+    Args:
+        source: Oracle PL/SQL code
+        owner: Oracle schema owner whose qualifiers should be replaced
+        new_owner: Owner to qualify with instead, None to remove them
+
+    Returns:
+        Source code with OWNER. and "OWNER". prefixes replaced
+    """
+    if not owner:
+        return source
+    pattern = r'(?:"{0}"|\b{0})\s*\.\s*'.format(re.escape(owner))
+    replacement = f"{new_owner}." if new_owner else ''
+    return re.sub(pattern, lambda match: replacement, source, flags=re.IGNORECASE)
+
+
+def owner_template(source: str, owner: str) -> str:
+    """
+    Make the source of one schema usable for every schema of its group
+
+    Owner qualifiers are replaced by OWNER_PLACEHOLDER and the object
+    name is qualified with it too, so the code converted from the
+    template can be given each schema back with fill_owner().
+
+    Args:
+        source: Oracle PL/SQL code as stored in all_source
+        owner: Oracle schema owner of the source
+
+    Returns:
+        Source code qualified with OWNER_PLACEHOLDER
+    """
+    source = replace_owner(source, owner, OWNER_PLACEHOLDER)
+    match = _OBJECT_NAME_PATTERN.match(source)
+    if match and not source[match.end():].startswith(f"{OWNER_PLACEHOLDER}."):
+        source = f"{source[:match.end()]}{OWNER_PLACEHOLDER}.{source[match.end():]}"
+    return source
+
+
+def fill_owner(code: str, owner: str) -> str:
+    """Qualify code built from owner_template() with the given owner"""
+    return code.replace(OWNER_PLACEHOLDER, owner)
+
+
+def normalize_source(source: str, owner: str = None) -> str:
+    """
+    Normalize source code for duplicate detection
+
+    Owner qualifiers are stripped, whitespace is collapsed and unquoted text
+    is uppercased. Comments, string literals and quoted identifiers are
+    left untouched.
+
+    Args:
+        source: Oracle PL/SQL code
+        owner: Oracle schema owner (optional)
+
+    Returns:
+        Normalized source code
+    """
+    source = strip_owner(source, owner)
+    parts = _VERBATIM_PATTERN.split(source)
+
+    normalized = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            normalized.append(part)
+        else:
+            normalized.append(re.sub(r'\s+', ' ', part).upper())
+
+    return ''.join(normalized).strip()
+
+
+def source_hash(source: str, owner: str = None) -> str:
+    """Get the SHA-256 hash of the normalized source code"""
+    normalized = normalize_source(source, owner)
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def group_duplicates(objects: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Group objects with identical normalized source
+
+    Args:
+        objects: Dicts with OWNER, OBJECT_NAME and SOURCE keys
+
+    Returns:
+        Dict mapping source hash to the list of objects sharing it,
+        in the order the objects were given
+    """
+    groups = {}
+    for obj in objects:
+        digest = source_hash(obj['SOURCE'], obj.get('OWNER'))
+        groups.setdefault(digest, []).append(obj)
+    return groups
+
+
+def format_duplicate_report(groups: Dict[str, List[Dict]]) -> List[str]:
+    """
+    Build a report of the duplicate groups
+
+    Args:
+        groups: Result of group_duplicates()
+
+    Returns:
+        Report lines
+    """
+    total = sum(len(members) for members in groups.values())
+    duplicates = {
+        digest: members for digest, members in groups.items()
+        if len(members) > 1
+    }
+
+    lines = [
+        "=== Duplicate Report ===",
+        f"Objects: {total}",
+        f"Distinct bodies: {len(groups)}",
+        f"Duplicate groups: {len(duplicates)}",
+    ]
+
+    ordered = sorted(duplicates.items(), key=lambda item: -len(item[1]))
+    for digest, members in ordered:
+        first = members[0]
+        lines.append("")
+        lines.append(
+            f"{digest[:12]} {first['OBJECT_NAME']} - {len(members)} copies"
+        )
+        for member in members:
+            lines.append(f"  - {member['OWNER']}.{member['OBJECT_NAME']}")
+
+    return lines
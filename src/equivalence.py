@@ -0,0 +1,272 @@
+"""
+Result equivalence checks between Oracle functions and their conversions
+Builds input tuples from a parameter set file or from the argument types
+and compares the results returned by both databases
+"""
+import itertools
+import json
+import random
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from converter import OracleToPostgreSQLConverter
+
+# Oracle argument types grouped by how inputs are generated
+TYPE_CATEGORIES = {
+    'NUMBER': 'number',
+    'FLOAT': 'number',
+    'BINARY_FLOAT': 'number',
+    'BINARY_DOUBLE': 'number',
+    'INTEGER': 'integer',
+    'BINARY_INTEGER': 'integer',
+    'PLS_INTEGER': 'integer',
+    'SIMPLE_INTEGER': 'integer',
+    'VARCHAR2': 'string',
+    'NVARCHAR2': 'string',
+    'VARCHAR': 'string',
+    'CHAR': 'string',
+    'NCHAR': 'string',
+    'CLOB': 'string',
+    'DATE': 'date',
+    'TIMESTAMP': 'date',
+}
+
+# Values that commonly expose conversion differences
+BOUNDARY_VALUES = {
+    'integer': [None, 0, 1, -1, 100, 2147483647, -2147483648],
+    'number': [None, 0, 1, -1, Decimal('0.5'), Decimal('-123.456'), 10 ** 15],
+    'string': [None, 'a', 'abc', ' padded ', "O'Reilly", 'ÄÖÜ', '12345'],
+    'date': [None, datetime(2000, 1, 1), datetime(1999, 12, 31, 23, 59, 59),
+             datetime(2024, 2, 29, 12, 0, 0), datetime(1970, 1, 1)],
+}
+
+
+def argument_category(data_type: str) -> Optional[str]:
+    """Get the input category of an Oracle argument type, None if unsupported"""
+    return TYPE_CATEGORIES.get(data_type.split('(')[0].strip().upper())
+
+
+def pg_argument_types(arguments: List[Dict]) -> List[str]:
+    """
+    Get the PostgreSQL types the inputs of a function are cast to
+
+    Args:
+        arguments: IN arguments of the function (DATA_TYPE key)
+
+    Returns:
+        One PostgreSQL type per argument
+    """
+    converter = OracleToPostgreSQLConverter()
+    types = []
+    for arg in arguments:
+        pg_type = converter.convert_data_type(arg['DATA_TYPE']).lower()
+        # A bare char cast means char(1) and would truncate the inputs
+        if pg_type.split('(')[0].strip() in ('char', 'character'):
+            pg_type = 'varchar'
+        types.append(pg_type)
+    return types
+
+
+def load_parameter_sets(path: str) -> Dict[str, List[List]]:
+    """
+    Load input tuples from a JSON parameter set file
+
+    The file maps function names to lists of argument lists, e.g.
+    {"GET_EMPLOYEE_FULLNAME": [[100], [101], [null]]}. Dates are given
+    as ISO 8601 strings.
+
+    Args:
+        path: Path of the parameter set file
+
+    Returns:
+        Dict mapping uppercased function names to input tuples
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return {name.upper(): rows for name, rows in data.items()}
+
+
+def coerce_inputs(rows: List[List], arguments: List[Dict]) -> List[Tuple]:
+    """
+    Convert input values loaded from a file to the argument types
+
+    Args:
+        rows: Input tuples
+        arguments: IN arguments of the function (DATA_TYPE key)
+
+    Returns:
+        Input tuples with ISO 8601 date strings parsed
+    """
+    categories = [argument_category(arg['DATA_TYPE']) for arg in arguments]
+    coerced = []
+    for row in rows:
+        if len(row) != len(arguments):
+            raise ValueError(
+                f"Expected {len(arguments)} arguments, got {len(row)}: {row}"
+            )
+        values = []
+        for value, category in zip(row, categories):
+            if category == 'date' and isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif category in ('number', 'integer') and isinstance(value, float):
+                value = Decimal(str(value))
+            values.append(value)
+        coerced.append(tuple(values))
+    return coerced
+
+
+def _random_value(rng: random.Random, category: str):
+    """Generate one random value of a category"""
+    if rng.random() < 0.05:
+        return None
+    if category == 'integer':
+        return rng.randint(-100000, 100000)
+    if category == 'number':
+        return Decimal(rng.randint(-10 ** 8, 10 ** 8)) / 100
+    if category == 'string':
+        length = rng.randint(1, 30)
+        return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ABCXYZ0123456789_-')
+                       for _ in range(length))
+    return datetime(1990, 1, 1) + timedelta(seconds=rng.randint(0, 40 * 365 * 86400))
+
+
+def generate_inputs(arguments: List[Dict], count: int = 1000, seed: int = 0) -> List[Tuple]:
+    """
+    Generate input tuples from the argument types
+
+    Combinations of boundary values come first, the rest is random. The
+    same seed always gives the same inputs.
+
+    Args:
+        arguments: IN arguments of the function (DATA_TYPE key)
+        count: Number of input tuples
+        seed: Random seed
+
+    Returns:
+        Input tuples
+    """
+    categories = [argument_category(arg['DATA_TYPE']) for arg in arguments]
+    if not categories:
+        return [()]
+
+    boundary = list(itertools.islice(
+        itertools.product(*[BOUNDARY_VALUES[category] for category in categories]),
+        count // 2
+    ))
+
+    rng = random.Random(seed)
+    generated = [
+        tuple(_random_value(rng, category) for category in categories)
+        for _ in range(count - len(boundary))
+    ]
+    return boundary + generated
+
+
+def normalize_value(value):
+    """Normalize a result value so both databases can be compared"""
+    # Oracle does not distinguish the empty string from NULL
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value)).normalize()
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def compare_results(inputs: List[Tuple], oracle_results: List[Tuple],
+                    pg_results: List[Tuple], max_examples: int = 20) -> Dict:
+    """
+    Compare the results of both databases
+
+    Args:
+        inputs: Input tuples
+        oracle_results: (ok, value or error message) for each input on Oracle
+        pg_results: (ok, value or error message) for each input on PostgreSQL
+        max_examples: Number of mismatches kept in the result
+
+    Returns:
+        Dict with the number of inputs, matches, mismatches, inputs that
+        failed on both sides and examples of the mismatches
+    """
+    summary = {
+        'inputs': len(inputs),
+        'matches': 0,
+        'both_errors': 0,
+        'mismatches': 0,
+        'examples': [],
+    }
+
+    for args, (oracle_ok, oracle_value), (pg_ok, pg_value) in \
+            zip(inputs, oracle_results, pg_results):
+        if not oracle_ok and not pg_ok:
+            summary['both_errors'] += 1
+            continue
+        if oracle_ok and pg_ok and normalize_value(oracle_value) == normalize_value(pg_value):
+            summary['matches'] += 1
+            continue
+
+        summary['mismatches'] += 1
+        if len(summary['examples']) < max_examples:
+            summary['examples'].append({
+                'args': args,
+                'oracle': oracle_value if oracle_ok else f"ERROR: {oracle_value}",
+                'postgresql': pg_value if pg_ok else f"ERROR: {pg_value}",
+            })
+
+    return summary
+
+
+def is_equivalent(summary: Dict) -> bool:
+    """
+    Check whether a function passed its equivalence check
+
+    At least one input must have given a comparable result, a function
+    that fails on both sides for every input proves nothing.
+    """
+    return summary['mismatches'] == 0 and summary['matches'] > 0
+
+
+def format_equivalence_report(results: Dict[str, Dict]) -> List[str]:
+    """
+    Build a report of the equivalence checks
+
+    Args:
+        results: Dict mapping function names to compare_results() output,
+            or to {'skipped': reason}
+
+    Returns:
+        Report lines
+    """
+    lines = ["=== Equivalence Report ==="]
+    passed = 0
+    for name, summary in results.items():
+        if 'skipped' in summary:
+            lines.append(f"- {name}: skipped ({summary['skipped']})")
+            continue
+
+        if is_equivalent(summary):
+            passed += 1
+            status = "✓"
+        else:
+            status = "✗"
+        lines.append(
+            f"{status} {name}: {summary['matches']}/{summary['inputs']} match, "
+            f"{summary['mismatches']} differ, {summary['both_errors']} fail on both"
+        )
+        if summary['matches'] == 0 and summary['mismatches'] == 0:
+            lines.append("    no input gave a result on both databases")
+        for example in summary['examples']:
+            lines.append(
+                f"    args={example['args']!r} oracle={example['oracle']!r} "
+                f"postgresql={example['postgresql']!r}"
+            )
+
+    checked = sum(1 for summary in results.values() if 'skipped' not in summary)
+    lines.append(f"\n{passed}/{checked} functions equivalent")
+    return lines
@@ -0,0 +1,317 @@
+"""
+Local stand-in for OracleConnector
+Serves all_objects, all_source and all_dependencies from an in-memory
+SQLite catalog with configurable latency per round trip, so the
+extraction pipeline can be benchmarked without a live Oracle
+"""
+import math
+import random
+import re
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from db_connector import OracleConnector
+
+CATALOG_SCHEMA = """
+    CREATE TABLE all_objects (
+        owner TEXT, object_name TEXT, object_type TEXT, status TEXT,
+        last_ddl_time TEXT
+    );
+    CREATE TABLE all_source (
+        owner TEXT, name TEXT, type TEXT, line INTEGER, text TEXT
+    );
+    CREATE TABLE all_dependencies (
+        owner TEXT, name TEXT, type TEXT,
+        referenced_owner TEXT, referenced_name TEXT, referenced_type TEXT
+    );
+    CREATE INDEX all_objects_owner ON all_objects (owner, object_name);
+    CREATE INDEX all_source_name ON all_source (owner, name, type, line);
+"""
+
+# Default number of rows per fetch round trip of cx_Oracle
+DEFAULT_ARRAYSIZE = 100
+
+_CREATE_PATTERN = re.compile(
+    r'CREATE\s+(?:OR\s+REPLACE\s+)?((PROCEDURE|FUNCTION|PACKAGE(?:\s+BODY)?)\s+(\w+))',
+    re.IGNORECASE
+)
+
+_TABLE_REFERENCE_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN|INSERT\s+INTO|MERGE\s+INTO|UPDATE)\s+(?:\w+\.)?(\w+)',
+    re.IGNORECASE
+)
+
+_SYNTHETIC_TEMPLATE = """PROCEDURE {name} (
+    p_id IN NUMBER,
+    p_amount OUT NUMBER
+)
+AS
+    v_total NUMBER := 0;
+    v_label VARCHAR2(100);
+    v_created DATE;
+BEGIN
+{body}
+    p_amount := NVL(v_total, 0);
+EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+        p_amount := 0;
+    WHEN OTHERS THEN
+        RAISE;
+END {name};
+"""
+
+_SYNTHETIC_BLOCK = """    SELECT NVL(SUM(amount), 0), MAX(label), SYSDATE
+    INTO v_total, v_label, v_created
+    FROM {owner}.{table}
+    WHERE id = p_id AND ROWNUM <= {step};
+    INSERT INTO {owner}.audit_log (id, log_id, created_at)
+    VALUES (p_id, {owner}.audit_seq.NEXTVAL, SYSDATE);
+"""
+
+
+class _LatencyCursor:
+    """SQLite cursor that behaves like a cx_Oracle cursor over a slow link"""
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.cursor = connector.catalog.cursor()
+        self.arraysize = DEFAULT_ARRAYSIZE
+
+    @property
+    def description(self):
+        # Oracle reports unquoted column names in uppercase
+        if self.cursor.description is None:
+            return None
+        return [(col[0].upper(),) + tuple(col[1:]) for col in self.cursor.description]
+
+    def execute(self, query, params=None, **kwargs):
+        self.connector.round_trip()
+        self.cursor.execute(query, params or kwargs)
+        return self
+
+    def fetchall(self):
+        rows = self.cursor.fetchall()
+        self.connector.round_trip(max(math.ceil(len(rows) / self.arraysize), 1))
+        return rows
+
+    def fetchmany(self, size=None):
+        self.connector.round_trip()
+        return self.cursor.fetchmany(size or self.arraysize)
+
+    def fetchone(self):
+        self.connector.round_trip()
+        return self.cursor.fetchone()
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self.cursor.close()
+
+
+class FakeOracleConnector(OracleConnector):
+    """Drop-in replacement for OracleConnector backed by a local catalog"""
+
+    def __init__(self, latency: float = 0.0, catalog_path: str = ':memory:'):
+        """
+        Args:
+            latency: Seconds added to every round trip
+            catalog_path: SQLite database holding the catalog, in memory
+                by default
+        """
+        super().__init__()
+        self.latency = latency
+        self.round_trips = 0
+        self.catalog = sqlite3.connect(catalog_path)
+        if not self.catalog.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'all_objects'"
+        ).fetchone():
+            self.catalog.executescript(CATALOG_SCHEMA)
+
+    def round_trip(self, count: int = 1):
+        """Account for round trips to the database, sleeping for their latency"""
+        self.round_trips += count
+        if self.latency:
+            time.sleep(self.latency * count)
+
+    def connect(self):
+        """Open a cursor on the local catalog"""
+        self.round_trip()
+        self.connection = self.catalog
+        self.cursor = _LatencyCursor(self)
+        count = self.catalog.execute("SELECT COUNT(*) FROM all_objects").fetchone()[0]
+        print(f"✓ Connected to fake Oracle catalog ({count} objects, "
+              f"{self.latency * 1000:.1f}ms per round trip)")
+        return True
+
+    def disconnect(self):
+        """Close the cursor, keeping the catalog for the next connection"""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
+            print("✓ Fake Oracle connection closed")
+
+    def add_object(self, owner: str, name: str, object_type: str, source: str,
+                   status: str = 'VALID'):
+        """
+        Add a procedure/function to the catalog
+
+        Args:
+            owner: Schema owner
+            name: Object name
+            object_type: PROCEDURE, FUNCTION, PACKAGE or PACKAGE BODY
+            source: Source code as stored in all_source, without CREATE OR REPLACE
+            status: Object status
+        """
+        owner = owner.upper()
+        name = name.upper()
+        object_type = object_type.upper()
+
+        self.catalog.execute(
+            "INSERT INTO all_objects VALUES (?, ?, ?, ?, ?)",
+            (owner, name, object_type, status, datetime.now().isoformat(sep=' '))
+        )
+        self.catalog.executemany(
+            "INSERT INTO all_source VALUES (?, ?, ?, ?, ?)",
+            [(owner, name, object_type, line, text)
+             for line, text in enumerate(source.splitlines(keepends=True), start=1)]
+        )
+
+    def add_dependency(self, owner: str, name: str, object_type: str,
+                       referenced_owner: str, referenced_name: str,
+                       referenced_type: str):
+        """Add a row to all_dependencies"""
+        self.catalog.execute(
+            "INSERT INTO all_dependencies VALUES (?, ?, ?, ?, ?, ?)",
+            (owner.upper(), name.upper(), object_type.upper(),
+             referenced_owner.upper(), referenced_name.upper(), referenced_type.upper())
+        )
+
+    def load_sql_file(self, path: str, owner: str = 'EXAMPLES') -> List[str]:
+        """
+        Load the procedures/functions of an Oracle SQL file
+
+        Objects are separated by lines holding a single slash, as in the
+        files under examples/. Table references are recorded as
+        dependencies.
+
+        Args:
+            path: Path of the SQL file
+            owner: Schema owner to load the objects into
+
+        Returns:
+            Names of the loaded objects
+        """
+        with open(path, 'r') as f:
+            content = f.read()
+
+        names = []
+        for block in re.split(r'^\s*/\s*$', content, flags=re.MULTILINE):
+            match = _CREATE_PATTERN.search(block)
+            if not match:
+                continue
+            object_type = ' '.join(match.group(2).upper().split())
+            name = match.group(3)
+            # all_source holds the code from the object type keyword on
+            source = block[match.start(1):].strip() + '\n'
+            self.add_object(owner, name, object_type, source)
+            for table in sorted(set(_TABLE_REFERENCE_PATTERN.findall(source))):
+                self.add_dependency(owner, name, object_type, owner, table, 'TABLE')
+            names.append(name.upper())
+
+        self.catalog.commit()
+        return names
+
+    def load_examples(self, directory: str = None, owner: str = 'EXAMPLES') -> List[str]:
+        """Load every SQL file of the examples directory"""
+        if directory is None:
+            directory = Path(__file__).resolve().parent.parent / 'examples'
+        names = []
+        for path in sorted(Path(directory).glob('*.sql')):
+            names.extend(self.load_sql_file(str(path), owner))
+        return names
+
+    def generate(self, schemas: int = 10, objects_per_schema: int = 100,
+                 blocks_per_object: int = 5, distinct_ratio: float = 0.0,
+                 seed: int = 0):
+        """
+        Fill the catalog with synthetic tenant schemas
+
+        Every schema holds the same procedures, identical apart from the
+        owner qualifiers, except for a distinct_ratio share of them that
+        get a schema specific body.
+
+        Args:
+            schemas: Number of schemas
+            objects_per_schema: Number of procedures per schema
+            blocks_per_object: Number of statement blocks per procedure,
+                about 6 source lines each
+            distinct_ratio: Share of procedures with a schema specific body
+            seed: Random seed
+        """
+        rng = random.Random(seed)
+        for schema in range(schemas):
+            owner = f"TENANT_{schema:04d}"
+            for index in range(objects_per_schema):
+                name = f"PROC_{index:05d}"
+                variant = schema if rng.random() < distinct_ratio else 0
+                body = ''.join(
+                    _SYNTHETIC_BLOCK.format(owner=owner, table=f"table_{(index + block) % 50}",
+                                            step=block + variant + 1)
+                    for block in range(blocks_per_object)
+                )
+                source = _SYNTHETIC_TEMPLATE.format(name=name, body=body)
+                self.add_object(owner, name, 'PROCEDURE', source)
+                self.add_dependency(owner, name, 'PROCEDURE', owner, 'AUDIT_LOG', 'TABLE')
+        self.catalog.commit()
+
+
+def benchmark(schemas: int = 10, objects_per_schema: int = 100, latency: float = 0.001,
+              dedup: bool = False, batch_size: int = 100, output_dir: str = None):
+    """
+    Run extract_and_convert against a synthetic catalog and report timings
+
+    Args:
+        schemas: Number of synthetic schemas
+        objects_per_schema: Number of procedures per schema
+        latency: Seconds added to every round trip
+        dedup: Convert identical bodies across schemas only once
+        batch_size: Number of objects fetched per round trip
+        output_dir: Output directory, a temporary one if omitted
+    """
+    from main import extract_and_convert
+
+    oracle = FakeOracleConnector(latency=latency)
+    oracle.generate(schemas=schemas, objects_per_schema=objects_per_schema)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        started = time.monotonic()
+        extract_and_convert(output_dir=output_dir or tmp_dir, dedup=dedup,
+                            batch_size=batch_size, oracle=oracle)
+        elapsed = time.monotonic() - started
+
+    print(f"\n=== Benchmark ===")
+    print(f"Objects: {schemas * objects_per_schema}")
+    print(f"Round trips: {oracle.round_trips}")
+    print(f"Elapsed: {elapsed:.2f}s")
+    return elapsed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the extraction pipeline offline")
+    parser.add_argument('--schemas', type=int, default=10)
+    parser.add_argument('--objects', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=1.0)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--dedup', action='store_true')
+    args = parser.parse_args()
+
+    benchmark(schemas=args.schemas, objects_per_schema=args.objects,
+              latency=args.latency_ms / 1000, dedup=args.dedup,
+              batch_size=args.batch_size)
@@ -4,32 +4,213 @@ Main script to extract Oracle procedures/functions and convert to PostgreSQL
 import os
 import sys
 from pathlib import Path
-from db_connector import OracleConnector, PostgreSQLConnector
+from db_connector import OracleConnector, PostgreSQLConnector, DDL_OBJECT_TYPES
 from converter import OracleToPostgreSQLConverter
+from dedup import group_duplicates, owner_template, fill_owner, format_duplicate_report
+from metrics import MigrationMetrics
+from manifest import RunManifest, MANIFEST_NAME, batches, raw_source_hash
+from sequence_sync import plan_sequence_sync, format_sync_report, ACTION_ADVANCE
+from equivalence import (
+    load_parameter_sets, coerce_inputs, generate_inputs, argument_category,
+    compare_results, format_equivalence_report, pg_argument_types, is_equivalent
+)
 
 
-def extract_and_convert(owner=None, output_dir='output'):
+def _save_outputs(output_dir, obj_name, source, pg_code, log_lines, verbose=True):
+    """Save Oracle source, PostgreSQL version and conversion log of an object"""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Save original Oracle code
+    oracle_file = os.path.join(output_dir, f"{obj_name}_oracle.sql")
+    with open(oracle_file, 'w') as f:
+        f.write(source)
+    if verbose:
+        print(f"  ✓ Saved Oracle source: {oracle_file}")
+    
+    # Save PostgreSQL code
+    pg_file = os.path.join(output_dir, f"{obj_name}_postgresql.sql")
+    with open(pg_file, 'w') as f:
+        f.write(pg_code)
+    if verbose:
+        print(f"  ✓ Saved PostgreSQL version: {pg_file}")
+    
+    # Save conversion log
+    log_file = os.path.join(output_dir, f"{obj_name}_conversion.log")
+    with open(log_file, 'w') as f:
+        f.write('\n'.join(log_lines))
+    if verbose:
+        print(f"  ✓ Saved conversion log: {log_file}")
+
+
+def _convert_deduplicated(oracle, procedures, owner, output_dir, metrics,
+                          manifest, batch_size, pg=None, partial=False):
+    """
+    Convert each distinct procedure/function body only once
+    
+    Sources are fetched in a single round trip, grouped by normalized
+    body and the conversion of each group is written for every member
+    under output_dir/<OWNER>/. Each group is converted once with a
+    placeholder owner, which is replaced by the owner of every member, so
+    all copies keep referencing their own schema. If partial is set, only
+    the sources of the given procedures are fetched instead of all
+    sources of the owner.
+    """
+    if not procedures:
+        return
+    
+    print(f"\n=== Fetching sources ===")
+    names = sorted({proc['OBJECT_NAME'] for proc in procedures}) if partial else None
+    with metrics.time('fetch'):
+        sources = oracle.get_procedure_sources(owner, names)
+    if sources is None:
+        print("Could not retrieve sources.")
+        return
+    
+    objects = []
+    for proc in procedures:
+        source = sources.get((proc['OWNER'], proc['OBJECT_NAME']))
+        if not source:
+            print(f"  ✗ Could not retrieve source for {proc['OWNER']}.{proc['OBJECT_NAME']}")
+            manifest.record_failed(manifest.key(proc['OWNER'], proc['OBJECT_NAME']),
+                                   'source not found')
+            metrics.increment('missing_source')
+            continue
+        objects.append(dict(proc, SOURCE=source))
+    
+    groups = group_duplicates(objects)
+    print(f"{len(objects)} objects, {len(groups)} distinct bodies")
+    metrics.total = len(objects)
+    
+    converter = OracleToPostgreSQLConverter(metrics=metrics)
+    
+    print(f"\n=== Converting distinct bodies ===")
+    for batch in batches(list(groups.items()), batch_size):
+        for digest, members in batch:
+            pending = [
+                member for member in members
+                if not manifest.is_done(manifest.key(member['OWNER'], member['OBJECT_NAME']),
+                                        raw_source_hash(member['SOURCE']))
+            ]
+            skipped = len(members) - len(pending)
+            if skipped:
+                metrics.increment('skipped', skipped)
+                metrics.total -= skipped
+            if not pending:
+                continue
+            
+            first = members[0]
+            print(f"\nProcessing {first['OBJECT_NAME']} ({first['OBJECT_TYPE']}) "
+                  f"- {len(pending)} copies...")
+            
+            try:
+                with metrics.time('convert'):
+                    converter.clear_log()
+                    template = converter.convert_procedure(
+                        owner_template(first['SOURCE'], first['OWNER'])
+                    )
+            except Exception as e:
+                print(f"  ✗ Conversion error: {e}")
+                for member in pending:
+                    manifest.record_failed(manifest.key(member['OWNER'], member['OBJECT_NAME']),
+                                           str(e), raw_source_hash(member['SOURCE']))
+                metrics.unit_done(failed=True, count=len(pending))
+                continue
+            template_log = converter.get_conversion_log() + [
+                f"\nConverted once for duplicate group {digest[:12]} "
+                f"(representative {first['OWNER']}.{first['OBJECT_NAME']})"
+            ]
+            
+            # Fan the converted body out to every schema that needs it
+            for member in pending:
+                key = manifest.key(member['OWNER'], member['OBJECT_NAME'])
+                member_dir = os.path.join(output_dir, member['OWNER'])
+                pg_code = fill_owner(template, member['OWNER'])
+                log_lines = [fill_owner(line, member['OWNER']) for line in template_log]
+                with metrics.time('write'):
+                    _save_outputs(member_dir, member['OBJECT_NAME'], member['SOURCE'],
+                                  pg_code, log_lines, verbose=False)
+                deployed = True
+                if pg:
+                    with metrics.time('deploy'):
+                        # The copy names its own schema for the function and
+                        # every reference, whatever the caller's search_path
+                        deployed = pg.execute_script(pg_code)
+                if deployed:
+                    manifest.record_done(key, raw_source_hash(member['SOURCE']),
+                                         member['LAST_DDL_TIME'])
+                else:
+                    manifest.record_failed(key, 'deploy failed', raw_source_hash(member['SOURCE']))
+                metrics.unit_done(failed=not deployed, show_progress=False)
+            metrics.increment('objects_written', len(pending))
+            print(f"  ✓ Saved {len(pending)} copies")
+            print(metrics.progress_line())
+        
+        manifest.save()
+    
+    report = format_duplicate_report(groups)
+    report_file = os.path.join(output_dir, "duplicate_report.txt")
+    with open(report_file, 'w') as f:
+        f.write('\n'.join(report))
+    print(f"\n✓ Saved duplicate report: {report_file}")
+
+
+def extract_and_convert(owner=None, output_dir='output', dedup=False,
+                        deploy=False, metrics_file=None, metrics_interval=10.0,
+                        resume=False, batch_size=100, oracle=None):
     """
     Extract procedures/functions from Oracle and convert to PostgreSQL
     
     Args:
         owner: Oracle schema owner (optional)
         output_dir: Directory to save converted files
+        dedup: Convert identical bodies across schemas only once
+        deploy: Create each converted object in PostgreSQL
+        metrics_file: Path of the metrics snapshot written during the run,
+            JSON if it ends with .json, Prometheus textfile otherwise
+        metrics_interval: Seconds between metrics snapshots
+        resume: Skip objects already converted by a previous run from the
+            same source, according to the manifest in output_dir
+        batch_size: Number of objects fetched per round trip and converted
+            between manifest saves
+        oracle: Connector to use instead of a new OracleConnector, e.g. a
+            fake_oracle.FakeOracleConnector for offline benchmarks
     """
     # Create output directory
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
+    metrics = MigrationMetrics(snapshot_file=metrics_file,
+                               snapshot_interval=metrics_interval)
+    
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if resume:
+        manifest = RunManifest.load(manifest_path)
+        print(f"\n=== Resuming run: {manifest.counts()} ===")
+    else:
+        manifest = RunManifest(manifest_path)
+    
     # Connect to Oracle
     print("\n=== Connecting to Oracle ===")
-    oracle = OracleConnector()
+    oracle = oracle or OracleConnector()
     if not oracle.connect():
         print("Failed to connect to Oracle. Exiting.")
         return
     
+    pg = None
+    if deploy:
+        print("\n=== Connecting to PostgreSQL ===")
+        pg = PostgreSQLConnector()
+        if not pg.connect():
+            print("Failed to connect to PostgreSQL. Exiting.")
+            oracle.disconnect()
+            return
+    
+    # Keep writing snapshots while a single long phase runs
+    metrics.start()
     try:
         # Get list of procedures/functions
         print(f"\n=== Fetching procedures/functions from Oracle ===")
-        procedures = oracle.get_procedures(owner)
+        with metrics.time('fetch'):
+            procedures = oracle.get_procedures(owner)
         
         if not procedures:
             print("No procedures/functions found.")
@@ -39,49 +220,360 @@ def extract_and_convert(owner=None, output_dir='output'):
         for proc in procedures:
             print(f"  - {proc['OBJECT_NAME']} ({proc['OBJECT_TYPE']}) - {proc['STATUS']}")
         
-        # Convert each procedure
-        converter = OracleToPostgreSQLConverter()
+        # Objects not redefined since they were converted are skipped
+        # without fetching their source again
+        remaining = [
+            proc for proc in procedures
+            if not manifest.is_unchanged(manifest.key(proc['OWNER'], proc['OBJECT_NAME']),
+                                         proc['LAST_DDL_TIME'])
+        ]
+        if len(remaining) < len(procedures):
+            print(f"Skipping {len(procedures) - len(remaining)} objects unchanged since the last run")
+            metrics.increment('skipped', len(procedures) - len(remaining))
+        metrics.total = len(remaining)
         
-        print(f"\n=== Converting procedures ===")
-        for proc in procedures:
+        if dedup:
+            _convert_deduplicated(oracle, remaining, owner, output_dir, metrics,
+                                  manifest, batch_size, pg,
+                                  partial=len(remaining) < len(procedures))
+        else:
+            _convert_each(oracle, remaining, owner, output_dir, metrics,
+                          manifest, batch_size, pg)
+        
+        print(f"\n=== Conversion Complete ===")
+        print(f"Output directory: {output_dir}")
+        for line in metrics.summary():
+            print(line)
+        
+        failures = manifest.failures()
+        if failures:
+            print(f"\n{len(failures)} objects failed, rerun with resume=True to retry them:")
+            for key, entry in sorted(failures.items()):
+                print(f"  - {key}: {entry['error']}")
+        
+    finally:
+        # Never replace a previous manifest before anything was processed
+        if manifest.changed:
+            manifest.save()
+        metrics.stop()
+        if metrics_file:
+            metrics.write_snapshot()
+        if pg:
+            pg.disconnect()
+        oracle.disconnect()
+
+
+def _convert_each(oracle, procedures, owner, output_dir, metrics, manifest,
+                  batch_size, pg=None):
+    """
+    Fetch, convert and save procedures/functions batch by batch
+    
+    The sources of each batch are fetched in one round trip and the
+    manifest is saved after every batch.
+    """
+    converter = OracleToPostgreSQLConverter(metrics=metrics)
+    
+    print(f"\n=== Converting procedures ===")
+    for batch in batches(procedures, batch_size):
+        # Get source code of the whole batch
+        with metrics.time('fetch'):
+            sources = oracle.get_procedure_sources(
+                owner, sorted({proc['OBJECT_NAME'] for proc in batch})
+            )
+        
+        if sources is None:
+            print(f"\n  ✗ Could not fetch sources of {len(batch)} objects, "
+                  f"rerun with resume=True to retry them")
+            for proc in batch:
+                manifest.record_failed(manifest.key(proc['OWNER'], proc['OBJECT_NAME']),
+                                       'fetch failed')
+                metrics.unit_done(failed=True, show_progress=False)
+            print(metrics.progress_line())
+            manifest.save()
+            continue
+        
+        for proc in batch:
             obj_name = proc['OBJECT_NAME']
             obj_type = proc['OBJECT_TYPE']
+            key = manifest.key(proc['OWNER'], obj_name)
+            source = sources.get((proc['OWNER'], obj_name))
+            
+            if not source:
+                print(f"\nProcessing {obj_name} ({obj_type})...")
+                print(f"  ✗ Could not retrieve source for {obj_name}")
+                manifest.record_failed(key, 'source not found')
+                metrics.unit_done(failed=True)
+                continue
+            
+            digest = raw_source_hash(source)
+            if manifest.is_done(key, digest):
+                metrics.increment('skipped')
+                metrics.total -= 1
+                continue
             
             print(f"\nProcessing {obj_name} ({obj_type})...")
             
-            # Get source code
-            source = oracle.get_procedure_source(obj_name, owner)
+            try:
+                # Convert to PostgreSQL
+                with metrics.time('convert'):
+                    converter.clear_log()
+                    pg_code = converter.convert_procedure(source)
+                
+                with metrics.time('write'):
+                    _save_outputs(output_dir, obj_name, source, pg_code,
+                                  converter.get_conversion_log())
+            except Exception as e:
+                print(f"  ✗ Conversion error: {e}")
+                manifest.record_failed(key, str(e), digest)
+                metrics.unit_done(failed=True)
+                continue
             
-            if not source:
-                print(f"  ✗ Could not retrieve source for {obj_name}")
+            deployed = True
+            if pg:
+                with metrics.time('deploy'):
+                    deployed = pg.execute_script(pg_code)
+            
+            if deployed:
+                manifest.record_done(key, digest, proc['LAST_DDL_TIME'])
+            else:
+                manifest.record_failed(key, 'deploy failed', digest)
+            metrics.unit_done(failed=not deployed)
+        
+        manifest.save()
+
+
+def extract_schema_ddl(owner, output_file='output/schema_postgresql.sql',
+                       object_types=DDL_OBJECT_TYPES, batch_size=500):
+    """
+    Extract the DDL of a schema from Oracle and write a PostgreSQL DDL script
+    
+    Objects are streamed from Oracle, converted and written one at a time,
+    ordered so that every object is created after the ones it needs:
+    sequences, tables, constraints, indexes, foreign keys and views.
+    
+    Args:
+        owner: Oracle schema owner
+        output_file: Path of the PostgreSQL DDL script
+        object_types: Object types to extract, in output order
+        batch_size: Number of objects fetched per round trip
+    """
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    
+    # Connect to Oracle
+    print("\n=== Connecting to Oracle ===")
+    oracle = OracleConnector()
+    if not oracle.connect():
+        print("Failed to connect to Oracle. Exiting.")
+        return
+    
+    try:
+        converter = OracleToPostgreSQLConverter()
+        counts = {}
+        warnings = []
+        
+        print(f"\n=== Extracting DDL of {owner} ===")
+        with open(output_file, 'w') as f:
+            f.write(f"-- PostgreSQL DDL converted from Oracle schema {owner}\n")
+            
+            current_type = None
+            for object_type, name, ddl in oracle.iter_ddl(owner, object_types, batch_size):
+                if object_type != current_type:
+                    current_type = object_type
+                    print(f"  - {object_type}")
+                    f.write(f"\n-- {object_type}\n\n")
+                
+                converter.clear_log()
+                f.write(converter.convert_ddl(ddl, owner) + '\n\n')
+                counts[object_type] = counts.get(object_type, 0) + 1
+                
+                warnings.extend(
+                    f"{object_type} {name}: {line}"
+                    for line in converter.get_conversion_log() if line.startswith('WARNING')
+                )
+            
+            # Make an incomplete script obvious to whoever runs it
+            if oracle.ddl_errors:
+                f.write("\n-- Objects that could not be extracted\n\n")
+                for object_type, name, error in oracle.ddl_errors:
+                    f.write(f"-- {object_type} {name or '(all)'}: {error}\n")
+        
+        print(f"\n=== DDL Conversion Complete ===")
+        for object_type, count in counts.items():
+            print(f"  {object_type}: {count}")
+        for warning in warnings:
+            print(f"  ⚠ {warning}")
+        for object_type, name, error in oracle.ddl_errors:
+            print(f"  ✗ {object_type} {name or '(all)'}: {error}")
+        if oracle.ddl_errors:
+            print(f"{len(oracle.ddl_errors)} DDL extraction errors, see the end of the output file")
+        print(f"Output file: {output_file}")
+        
+    finally:
+        oracle.disconnect()
+
+
+def sync_sequences(owner=None, pg_schema=None, dry_run=False):
+    """
+    Advance PostgreSQL sequences to the values reached in Oracle
+    
+    All Oracle sequences are read in one query and all changes are sent
+    to PostgreSQL in one round trip, so this can be rerun just before
+    cutover.
+    
+    Args:
+        owner: Oracle schema owner (optional)
+        pg_schema: PostgreSQL schema holding the sequences (optional,
+            defaults to the lowercased Oracle owner)
+        dry_run: Only report the drift, do not change anything
+    
+    Returns:
+        The sync plan, see sequence_sync.plan_sequence_sync()
+    """
+    print("\n=== Connecting to databases ===")
+    oracle = OracleConnector()
+    if not oracle.connect():
+        print("Failed to connect to Oracle. Exiting.")
+        return None
+    
+    pg = PostgreSQLConnector()
+    if not pg.connect():
+        print("Failed to connect to PostgreSQL. Exiting.")
+        oracle.disconnect()
+        return None
+    
+    try:
+        print(f"\n=== Reading sequences ===")
+        oracle_sequences = oracle.get_sequences(owner)
+        pg_sequences = pg.get_sequences(pg_schema)
+        if oracle_sequences is None or pg_sequences is None:
+            print("Could not read sequences.")
+            return None
+        
+        plan = plan_sequence_sync(oracle_sequences, pg_sequences, pg_schema)
+        for line in format_sync_report(plan):
+            print(line)
+        
+        values = [
+            (entry['name'], entry['oracle_next'])
+            for entry in plan if entry['action'] == ACTION_ADVANCE
+        ]
+        if dry_run:
+            print(f"\nDry run: {len(values)} sequences would be advanced")
+        elif pg.set_sequence_values(values):
+            print(f"\n✓ Advanced {len(values)} sequences")
+        else:
+            print(f"\n✗ Failed to advance sequences, none were changed")
+        
+        return plan
+        
+    finally:
+        pg.disconnect()
+        oracle.disconnect()
+
+
+def compare_functions(function_names=None, owner=None, param_file=None, count=1000,
+                      batch_size=500, pg_schema=None, report_file=None, seed=0):
+    """
+    Check that converted functions return the same results as on Oracle
+    
+    Each function is called on both databases with the inputs from the
+    parameter set file, or with inputs generated from its argument types,
+    over one connection per database and batch_size inputs per round trip.
+    
+    Args:
+        function_names: Functions to check (optional, all standalone
+            functions of the owner if omitted)
+        owner: Oracle schema owner (optional)
+        param_file: JSON parameter set file, see equivalence.load_parameter_sets()
+        count: Number of generated inputs per function
+        batch_size: Number of inputs per round trip
+        pg_schema: PostgreSQL schema holding the converted functions (optional)
+        report_file: Path to save the report (optional)
+        seed: Random seed of the generated inputs
+    
+    Returns:
+        Dict mapping function names to their comparison summary
+    """
+    param_sets = load_parameter_sets(param_file) if param_file else {}
+    
+    print("\n=== Connecting to databases ===")
+    oracle = OracleConnector()
+    if not oracle.connect():
+        print("Failed to connect to Oracle. Exiting.")
+        return None
+    
+    pg = PostgreSQLConnector()
+    if not pg.connect():
+        print("Failed to connect to PostgreSQL. Exiting.")
+        oracle.disconnect()
+        return None
+    
+    try:
+        if function_names is None:
+            function_names = [
+                proc['OBJECT_NAME'] for proc in oracle.get_procedures(owner) or []
+                if proc['OBJECT_TYPE'] == 'FUNCTION'
+            ]
+        
+        results = {}
+        
+        for name in function_names:
+            name = name.upper()
+            print(f"\nComparing {name}...")
+            
+            arguments = oracle.get_function_arguments(name, owner) or []
+            owners = sorted({arg['OWNER'] for arg in arguments})
+            if len(owners) > 1:
+                results[name] = {'skipped': f"defined in schemas {', '.join(owners)}, "
+                                            f"pass the owner"}
+                continue
+            if not any(arg['POSITION'] == 0 for arg in arguments):
+                results[name] = {'skipped': 'not a standalone function'}
+                continue
+            in_arguments = [arg for arg in arguments if arg['POSITION'] > 0]
+            if any(arg['IN_OUT'] != 'IN' for arg in in_arguments):
+                results[name] = {'skipped': 'has OUT arguments'}
+                continue
+            unsupported = [arg['DATA_TYPE'] for arg in in_arguments
+                           if argument_category(arg['DATA_TYPE']) is None]
+            if unsupported:
+                results[name] = {'skipped': f"unsupported argument types {unsupported}"}
                 continue
             
-            # Save original Oracle code
-            oracle_file = os.path.join(output_dir, f"{obj_name}_oracle.sql")
-            with open(oracle_file, 'w') as f:
-                f.write(source)
-            print(f"  ✓ Saved Oracle source: {oracle_file}")
+            if name in param_sets:
+                inputs = coerce_inputs(param_sets[name], in_arguments)
+            else:
+                inputs = generate_inputs(in_arguments, count, seed)
             
-            # Convert to PostgreSQL
-            converter.clear_log()
-            pg_code = converter.convert_procedure(source)
+            oracle_name = f"{owners[0]}.{name}"
+            pg_name = f"{pg_schema}.{name.lower()}" if pg_schema else name.lower()
+            arg_types = pg_argument_types(in_arguments)
             
-            # Save PostgreSQL code
-            pg_file = os.path.join(output_dir, f"{obj_name}_postgresql.sql")
-            with open(pg_file, 'w') as f:
-                f.write(pg_code)
-            print(f"  ✓ Saved PostgreSQL version: {pg_file}")
+            oracle_results = []
+            pg_results = []
+            for batch in batches(inputs, batch_size):
+                oracle_results.extend(oracle.call_function_batch(oracle_name, batch))
+                pg_results.extend(pg.call_function_batch(pg_name, batch, arg_types))
             
-            # Save conversion log
-            log_file = os.path.join(output_dir, f"{obj_name}_conversion.log")
-            with open(log_file, 'w') as f:
-                f.write('\n'.join(converter.get_conversion_log()))
-            print(f"  ✓ Saved conversion log: {log_file}")
+            summary = compare_results(inputs, oracle_results, pg_results)
+            results[name] = summary
+            status = "✓" if is_equivalent(summary) else "✗"
+            print(f"  {status} {summary['matches']}/{summary['inputs']} match, "
+                  f"{summary['mismatches']} differ")
         
-        print(f"\n=== Conversion Complete ===")
-        print(f"Output directory: {output_dir}")
+        report = format_equivalence_report(results)
+        print()
+        for line in report:
+            print(line)
+        if report_file:
+            with open(report_file, 'w') as f:
+                f.write('\n'.join(report))
+            print(f"\n✓ Saved report: {report_file}")
+        
+        return results
         
     finally:
+        pg.disconnect()
         oracle.disconnect()
 
 
@@ -139,6 +631,9 @@ def interactive_menu():
         print("3. Extract and convert by schema owner")
         print("4. Convert a single SQL file")
         print("5. Test converted procedure on PostgreSQL")
+        print("6. Extract and convert schema DDL (tables, indexes, views, ...)")
+        print("7. Sync sequences from Oracle to PostgreSQL")
+        print("8. Compare converted functions with Oracle results")
         print("0. Exit")
         print("="*50)
         
@@ -150,12 +645,15 @@ def interactive_menu():
             
         elif choice == '2':
             output = input("Output directory (default: output): ").strip() or 'output'
-            extract_and_convert(owner=None, output_dir=output)
+            dedup = input("Deduplicate identical bodies across schemas? (y/N): ").strip().lower() == 'y'
+            resume = input("Resume previous run in this directory? (y/N): ").strip().lower() == 'y'
+            extract_and_convert(owner=None, output_dir=output, dedup=dedup, resume=resume)
             
         elif choice == '3':
             owner = input("Enter schema owner: ").strip()
             output = input("Output directory (default: output): ").strip() or 'output'
-            extract_and_convert(owner=owner, output_dir=output)
+            resume = input("Resume previous run in this directory? (y/N): ").strip().lower() == 'y'
+            extract_and_convert(owner=owner, output_dir=output, resume=resume)
             
         elif choice == '4':
             input_file = input("Enter Oracle SQL file path: ").strip()
@@ -176,6 +674,28 @@ def interactive_menu():
             else:
                 print(f"File not found: {pg_file}")
                 
+        elif choice == '6':
+            owner = input("Enter schema owner: ").strip()
+            output_file = input("Output file (default: output/schema_postgresql.sql): ").strip() \
+                or 'output/schema_postgresql.sql'
+            extract_schema_ddl(owner=owner, output_file=output_file)
+            
+        elif choice == '7':
+            owner = input("Enter schema owner (optional): ").strip() or None
+            pg_schema = input("PostgreSQL schema (default: lowercased owner): ").strip() or None
+            dry_run = input("Dry run? (y/N): ").strip().lower() == 'y'
+            sync_sequences(owner=owner, pg_schema=pg_schema, dry_run=dry_run)
+            
+        elif choice == '8':
+            owner = input("Enter schema owner (optional): ").strip() or None
+            names = input("Function names, comma separated (default: all): ").strip()
+            param_file = input("Parameter set file (optional): ").strip() or None
+            report_file = input("Report file (optional): ").strip() or None
+            compare_functions(
+                function_names=[n.strip() for n in names.split(',')] if names else None,
+                owner=owner, param_file=param_file, report_file=report_file
+            )
+            
         elif choice == '0':
             print("Goodbye!")
             break
@@ -0,0 +1,143 @@
+"""
+Run manifest for resumable extraction runs
+Records the status and source hash of every converted object so an
+interrupted run can skip the work already done
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class RunManifest:
+    """Completed and failed objects of an extraction run"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path of the manifest file
+        """
+        self.path = path
+        self.objects = {}
+        # Whether anything was recorded since the manifest was loaded or saved
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: str) -> 'RunManifest':
+        """
+        Load a manifest from disk
+
+        Args:
+            path: Path of the manifest file
+
+        Returns:
+            The loaded manifest, or an empty one if the file does not exist
+        """
+        manifest = cls(path)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            manifest.objects = data.get('objects', {})
+        return manifest
+
+    @staticmethod
+    def key(owner: str, name: str) -> str:
+        """Get the manifest key of an object"""
+        return f"{owner}.{name}" if owner else name
+
+    def is_done(self, key: str, source_hash: str) -> bool:
+        """Check whether an object was converted from the same source"""
+        entry = self.objects.get(key)
+        return bool(entry) and entry['status'] == STATUS_DONE and \
+            entry.get('source_hash') == source_hash
+
+    def is_unchanged(self, key: str, ddl_time) -> bool:
+        """
+        Check whether an object was converted and not redefined since
+
+        Unlike is_done(), this needs only the catalog's LAST_DDL_TIME, so
+        the source does not have to be fetched again.
+        """
+        entry = self.objects.get(key)
+        return bool(entry) and ddl_time is not None and \
+            entry['status'] == STATUS_DONE and entry.get('ddl_time') == str(ddl_time)
+
+    def record_done(self, key: str, source_hash: str, ddl_time=None):
+        """Record a successfully converted object"""
+        self.objects[key] = {
+            'status': STATUS_DONE,
+            'source_hash': source_hash,
+            'ddl_time': None if ddl_time is None else str(ddl_time),
+            'updated': _now(),
+        }
+        self.changed = True
+
+    def record_failed(self, key: str, error: str, source_hash: Optional[str] = None):
+        """Record an object that could not be converted"""
+        self.objects[key] = {
+            'status': STATUS_FAILED,
+            'source_hash': source_hash,
+            'error': error,
+            'updated': _now(),
+        }
+        self.changed = True
+
+    def failures(self) -> Dict[str, Dict]:
+        """Get the entries of all failed objects"""
+        return {
+            key: entry for key, entry in self.objects.items()
+            if entry['status'] == STATUS_FAILED
+        }
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of objects per status"""
+        counts = {}
+        for entry in self.objects.values():
+            counts[entry['status']] = counts.get(entry['status'], 0) + 1
+        return counts
+
+    def save(self):
+        """Write the manifest atomically"""
+        data = {
+            'version': MANIFEST_VERSION,
+            'updated': _now(),
+            'objects': self.objects,
+        }
+
+        # Write to a temporary file and rename, so a crash never leaves
+        # a truncated manifest behind
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.changed = False
+
+
+def raw_source_hash(source: str) -> str:
+    """
+    Get the SHA-256 hash of the source code exactly as extracted
+
+    Unlike dedup.source_hash(), any change to the source, even in
+    whitespace or case, gives a different hash.
+    """
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def batches(items: List, size: int):
+    """Split a list into consecutive batches of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _now() -> str:
+    """Current time as an ISO 8601 string"""
+    return datetime.now().isoformat(timespec='seconds')
@@ -0,0 +1,348 @@
+"""
+Progress and throughput metrics for long extraction runs
+Tracks counters and per-phase latency histograms, prints a progress line
+and periodically writes a Prometheus textfile or JSON snapshot
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+PHASES = ('fetch', 'convert', 'format', 'write', 'deploy')
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+METRIC_PREFIX = 'oracle_convert'
+
+
+class PhaseHistogram:
+    """Latency histogram of a single phase"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        """Record one observation"""
+        self.count += 1
+        self.sum += seconds
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def cumulative_counts(self) -> List[int]:
+        """Get bucket counts as cumulative values, as Prometheus expects"""
+        counts = []
+        running = 0
+        for value in self.bucket_counts:
+            running += value
+            counts.append(running)
+        return counts
+
+
+class MigrationMetrics:
+    """Counters, phase latencies and progress of a migration run"""
+
+    def __init__(self, total: int = 0, snapshot_file: Optional[str] = None,
+                 snapshot_interval: float = 10.0):
+        """
+        Args:
+            total: Number of units of work expected (used for the ETA)
+            snapshot_file: Path of the snapshot to write periodically,
+                JSON if it ends with .json, Prometheus textfile otherwise
+            snapshot_interval: Seconds between snapshot writes
+        """
+        self.total = total
+        self.snapshot_file = snapshot_file
+        self.snapshot_interval = snapshot_interval
+        self.counters = {}
+        self.histograms = {phase: PhaseHistogram() for phase in PHASES}
+        self.started = time.monotonic()
+        self._last_snapshot = self.started
+        self._stack = []
+        # Guards counters, histograms and snapshot files against the
+        # snapshot thread
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @contextmanager
+    def time(self, phase: str):
+        """
+        Time a block of code as the given phase
+
+        Nested phases are subtracted from the enclosing phase, so every
+        phase reports only its own time.
+        """
+        frame = [time.monotonic(), 0.0, phase]
+        with self._lock:
+            self._stack.append(frame)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stack.pop()
+                elapsed = time.monotonic() - frame[0]
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+                self.observe(phase, elapsed - frame[1])
+            self.maybe_write_snapshot()
+
+    def observe(self, phase: str, seconds: float):
+        """Record a latency observation for a phase"""
+        with self._lock:
+            if phase not in self.histograms:
+                self.histograms[phase] = PhaseHistogram()
+            self.histograms[phase].observe(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        """Increment a counter"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @property
+    def completed(self) -> int:
+        """Number of units of work finished, successfully or not"""
+        return self.counters.get('done', 0) + self.counters.get('failed', 0)
+
+    def unit_done(self, failed: bool = False, show_progress: bool = True, count: int = 1):
+        """
+        Mark units of work as finished
+
+        Args:
+            failed: Whether the units failed
+            show_progress: Print the progress line
+            count: Number of units finished
+        """
+        self.increment('failed' if failed else 'done', count)
+        if show_progress:
+            print(self.progress_line())
+        self.maybe_write_snapshot()
+
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return time.monotonic() - self.started
+
+    def rate(self) -> float:
+        """Units of work finished per second"""
+        elapsed = self.elapsed()
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> Optional[float]:
+        """Estimated seconds remaining, None if unknown"""
+        rate = self.rate()
+        if not self.total or rate <= 0:
+            return None
+        return max(self.total - self.completed, 0) / rate
+
+    def phase_shares(self) -> Dict[str, float]:
+        """Fraction of the measured time spent in each phase"""
+        measured = sum(h.sum for h in self.histograms.values())
+        if measured <= 0:
+            return {}
+        return {
+            phase: h.sum / measured
+            for phase, h in self.histograms.items() if h.count
+        }
+
+    def progress_line(self) -> str:
+        """Build a one-line progress summary"""
+        parts = []
+        if self.total:
+            percent = 100.0 * self.completed / self.total
+            parts.append(f"[{self.completed}/{self.total}] {percent:.1f}%")
+        else:
+            parts.append(f"[{self.completed}]")
+        parts.append(f"{self.rate():.1f} obj/s")
+
+        eta = self.eta()
+        if eta is not None:
+            parts.append(f"ETA {_format_duration(eta)}")
+
+        shares = self.phase_shares()
+        if shares:
+            parts.append(' '.join(
+                f"{phase} {share * 100:.0f}%" for phase, share in shares.items()
+            ))
+
+        if self.counters.get('failed'):
+            parts.append(f"{self.counters['failed']} failed")
+
+        return '  ' + ' | '.join(parts)
+
+    def snapshot(self) -> Dict:
+        """Get the current metrics as a dict"""
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> Dict:
+        """Build the snapshot, with the lock held"""
+        return {
+            'timestamp': time.time(),
+            'elapsed_seconds': self.elapsed(),
+            'total': self.total,
+            'completed': self.completed,
+            'objects_per_second': self.rate(),
+            'eta_seconds': self.eta(),
+            'counters': dict(self.counters),
+            'phases_in_progress': self.phases_in_progress(),
+            'phases': {
+                phase: {
+                    'count': h.count,
+                    'sum_seconds': h.sum,
+                    'buckets': dict(zip(
+                        [str(bound) for bound in BUCKETS] + ['+Inf'],
+                        h.cumulative_counts() + [h.count]
+                    )),
+                }
+                for phase, h in self.histograms.items()
+            },
+        }
+
+    def phases_in_progress(self) -> Dict[str, float]:
+        """Seconds spent so far in each phase that has not finished yet"""
+        now = time.monotonic()
+        with self._lock:
+            return {phase: now - started for started, _, phase in self._stack}
+
+    def to_prometheus(self) -> str:
+        """Render the current metrics in the Prometheus text format"""
+        with self._lock:
+            return self._to_prometheus()
+
+    def _to_prometheus(self) -> str:
+        """Render the Prometheus text, with the lock held"""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines += [
+                f"# TYPE {METRIC_PREFIX}_{name}_total counter",
+                f"{METRIC_PREFIX}_{name}_total {value}",
+            ]
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_units_expected Units of work expected",
+            f"# TYPE {METRIC_PREFIX}_units_expected gauge",
+            f"{METRIC_PREFIX}_units_expected {self.total}",
+            f"# HELP {METRIC_PREFIX}_units_per_second Throughput since start",
+            f"# TYPE {METRIC_PREFIX}_units_per_second gauge",
+            f"{METRIC_PREFIX}_units_per_second {self.rate():.6f}",
+        ]
+
+        eta = self.eta()
+        if eta is not None:
+            lines += [
+                f"# HELP {METRIC_PREFIX}_eta_seconds Estimated time remaining",
+                f"# TYPE {METRIC_PREFIX}_eta_seconds gauge",
+                f"{METRIC_PREFIX}_eta_seconds {eta:.3f}",
+            ]
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_phase_in_progress_seconds Time spent so far in running phases",
+            f"# TYPE {METRIC_PREFIX}_phase_in_progress_seconds gauge",
+        ]
+        for phase, seconds in self.phases_in_progress().items():
+            lines.append(
+                f'{METRIC_PREFIX}_phase_in_progress_seconds{{phase="{phase}"}} {seconds:.3f}'
+            )
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_phase_seconds Time spent per phase",
+            f"# TYPE {METRIC_PREFIX}_phase_seconds histogram",
+        ]
+        for phase, h in self.histograms.items():
+            for bound, count in zip(BUCKETS, h.cumulative_counts()):
+                lines.append(
+                    f'{METRIC_PREFIX}_phase_seconds_bucket{{phase="{phase}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'{METRIC_PREFIX}_phase_seconds_bucket{{phase="{phase}",le="+Inf"}} {h.count}'
+            )
+            lines.append(f'{METRIC_PREFIX}_phase_seconds_sum{{phase="{phase}"}} {h.sum:.6f}')
+            lines.append(f'{METRIC_PREFIX}_phase_seconds_count{{phase="{phase}"}} {h.count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_snapshot(self, path: Optional[str] = None):
+        """
+        Write the current metrics to a file atomically
+
+        Args:
+            path: Output path, defaults to snapshot_file. Files ending in
+                .json get a JSON snapshot, others a Prometheus textfile.
+        """
+        path = path or self.snapshot_file
+        if not path:
+            return
+
+        with self._lock:
+            if path.endswith('.json'):
+                content = json.dumps(self.snapshot(), indent=2)
+            else:
+                content = self.to_prometheus()
+
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            self._last_snapshot = time.monotonic()
+
+    def maybe_write_snapshot(self):
+        """Write a snapshot if the snapshot interval has passed"""
+        if not self.snapshot_file:
+            return
+        if time.monotonic() - self._last_snapshot >= self.snapshot_interval:
+            self.write_snapshot()
+
+    def start(self):
+        """
+        Write snapshots from a background thread every snapshot_interval
+
+        Snapshots then keep coming while a single phase runs for long,
+        such as a slow fetch or a stuck deploy.
+        """
+        if not self.snapshot_file or self._thread:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._snapshot_loop,
+                                        name='metrics-snapshot', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the snapshot thread"""
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _snapshot_loop(self):
+        """Write a snapshot every snapshot_interval until stopped"""
+        while not self._stop.wait(self.snapshot_interval):
+            self.write_snapshot()
+
+    def summary(self) -> List[str]:
+        """Build the end of run summary"""
+        lines = [
+            f"Elapsed: {_format_duration(self.elapsed())}",
+            f"Finished: {self.completed} ({self.rate():.1f} obj/s)",
+        ]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name}: {value}")
+        for phase, h in self.histograms.items():
+            if h.count:
+                lines.append(
+                    f"  {phase}: {h.sum:.2f}s total, "
+                    f"{h.sum / h.count * 1000:.1f}ms avg over {h.count}"
+                )
+        return lines
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as H:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
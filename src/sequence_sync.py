@@ -0,0 +1,136 @@
+"""
+Sequence synchronization between Oracle and PostgreSQL
+Advances PostgreSQL sequences to the values reached in Oracle after the
+data has been copied
+"""
+from typing import Dict, List, Optional
+
+ACTION_ADVANCE = 'advance'
+ACTION_OK = 'ok'
+ACTION_AHEAD = 'ahead'
+ACTION_MISSING = 'missing'
+ACTION_OUT_OF_RANGE = 'out_of_range'
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a PostgreSQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def plan_sequence_sync(oracle_sequences: List[Dict], pg_sequences: List[Dict],
+                       pg_schema: Optional[str] = None) -> List[Dict]:
+    """
+    Compare Oracle and PostgreSQL sequences and decide what to change
+
+    Oracle's LAST_NUMBER is the next value not yet handed out, including
+    cached values, so it is always safe to continue from it. Sequences
+    are matched by lowercased name, in pg_schema if given or else in the
+    schema named after the lowercased Oracle owner. PostgreSQL sequences
+    are never moved backwards, nor advanced past their MINVALUE/MAXVALUE.
+
+    Args:
+        oracle_sequences: Rows of all_sequences (SEQUENCE_OWNER,
+            SEQUENCE_NAME, LAST_NUMBER, INCREMENT_BY)
+        pg_sequences: Result of PostgreSQLConnector.get_sequences()
+            (schemaname, sequencename, min_value, max_value,
+            increment_by, last_value, is_called)
+        pg_schema: PostgreSQL schema holding all sequences (optional)
+
+    Returns:
+        One dict per Oracle sequence with the PostgreSQL name, both next
+        values, the drift and the action to take
+    """
+    pg_by_name = {
+        (row['schemaname'], row['sequencename']): row for row in pg_sequences
+    }
+
+    plan = []
+    for row in oracle_sequences:
+        schema = pg_schema or row['SEQUENCE_OWNER'].lower()
+        name = row['SEQUENCE_NAME'].lower()
+        oracle_next = int(row['LAST_NUMBER'])
+        entry = {
+            'name': f"{quote_identifier(schema)}.{quote_identifier(name)}",
+            'oracle_next': oracle_next,
+            'pg_next': None,
+            'drift': None,
+        }
+
+        pg_row = pg_by_name.get((schema, name))
+        if not pg_row:
+            entry['action'] = ACTION_MISSING
+            plan.append(entry)
+            continue
+
+        # After setval(n, false) last_value is n itself, the value the
+        # next nextval() call returns
+        pg_next = int(pg_row['last_value'])
+        if pg_row['is_called']:
+            pg_next += int(pg_row['increment_by'])
+
+        # Drift is how far PostgreSQL lags behind Oracle, in the
+        # direction the sequence moves
+        drift = oracle_next - pg_next
+        if int(row['INCREMENT_BY']) < 0:
+            drift = -drift
+
+        entry['pg_next'] = pg_next
+        entry['drift'] = drift
+        if drift > 0 and not \
+                int(pg_row['min_value']) <= oracle_next <= int(pg_row['max_value']):
+            entry['action'] = ACTION_OUT_OF_RANGE
+            entry['min_value'] = int(pg_row['min_value'])
+            entry['max_value'] = int(pg_row['max_value'])
+        elif drift > 0:
+            entry['action'] = ACTION_ADVANCE
+        elif drift < 0:
+            entry['action'] = ACTION_AHEAD
+        else:
+            entry['action'] = ACTION_OK
+        plan.append(entry)
+
+    return plan
+
+
+def format_sync_report(plan: List[Dict]) -> List[str]:
+    """
+    Build a report of the sequence drift
+
+    Args:
+        plan: Result of plan_sequence_sync()
+
+    Returns:
+        Report lines
+    """
+    counts = {}
+    for entry in plan:
+        counts[entry['action']] = counts.get(entry['action'], 0) + 1
+
+    lines = [
+        "=== Sequence Sync Report ===",
+        f"Sequences: {len(plan)}",
+    ]
+    for action in (ACTION_ADVANCE, ACTION_OK, ACTION_AHEAD, ACTION_MISSING,
+                   ACTION_OUT_OF_RANGE):
+        lines.append(f"  {action}: {counts.get(action, 0)}")
+
+    for entry in plan:
+        if entry['action'] == ACTION_ADVANCE:
+            lines.append(
+                f"  ↑ {entry['name']}: {entry['pg_next']} -> {entry['oracle_next']} "
+                f"(drift {entry['drift']})"
+            )
+        elif entry['action'] == ACTION_AHEAD:
+            lines.append(
+                f"  ⚠ {entry['name']}: PostgreSQL at {entry['pg_next']} is ahead of "
+                f"Oracle at {entry['oracle_next']}"
+            )
+        elif entry['action'] == ACTION_MISSING:
+            lines.append(f"  ✗ {entry['name']}: not found in PostgreSQL")
+        elif entry['action'] == ACTION_OUT_OF_RANGE:
+            lines.append(
+                f"  ✗ {entry['name']}: Oracle at {entry['oracle_next']} is outside "
+                f"MINVALUE {entry['min_value']} / MAXVALUE {entry['max_value']}"
+            )
+
+    return lines
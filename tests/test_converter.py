@@ -99,6 +99,12 @@ class TestConverter:
         assert 'seq_id.NEXTVAL' not in result
         assert "NEXTVAL('seq_id')" in result
     
+    def test_convert_qualified_sequence(self):
+        """Test schema qualified sequence conversion"""
+        result = self.converter.convert_procedure("v_id := hr.seq_id.NEXTVAL;")
+        
+        assert "NEXTVAL('hr.seq_id')" in result
+    
     def test_convert_dual(self):
         """Test DUAL table removal"""
         oracle_code = """
@@ -116,6 +122,135 @@ class TestConverter:
         
         assert 'FROM DUAL' not in result.upper()
 
+    
+    def test_convert_table_ddl(self):
+        """Test DBMS_METADATA table DDL conversion"""
+        oracle_ddl = """
+          CREATE TABLE "HR"."EMPLOYEES"
+           (	"ID" NUMBER(10,0) NOT NULL ENABLE,
+        	"NAME" VARCHAR2(50 BYTE),
+        	"USER" VARCHAR2(30),
+        	"HIRED" DATE DEFAULT SYSDATE
+           ) SEGMENT CREATION IMMEDIATE ;
+        """
+        
+        result = self.converter.convert_ddl(oracle_ddl, 'HR')
+        
+        assert 'CREATE TABLE employees' in result
+        assert 'id NUMERIC(10,0) NOT NULL,' in result
+        assert 'name VARCHAR(50)' in result
+        assert '"user" VARCHAR(30)' in result
+        assert 'hired TIMESTAMP DEFAULT CURRENT_TIMESTAMP' in result
+        assert 'SEGMENT CREATION' not in result
+        assert 'HR' not in result
+    
+    def test_convert_quoted_column_named_like_type(self):
+        """Test quoted identifiers are not converted as data types"""
+        oracle_ddl = 'CREATE TABLE "T" ("DATE" DATE, "Mixed" NUMBER)'
+        
+        result = self.converter.convert_ddl(oracle_ddl)
+        
+        assert result == 'CREATE TABLE t (date TIMESTAMP, "Mixed" NUMERIC);'
+    
+    def test_convert_ddl_keeps_string_literals(self):
+        """Test string literals in CHECK and DEFAULT clauses are not converted"""
+        table_ddl = """
+          CREATE TABLE "HR"."JOBS"
+           (	"KIND" VARCHAR2(10) DEFAULT 'LONG',
+        	"NOTE" VARCHAR2(30) DEFAULT 'it''s a DATE'
+           ) ;
+        """
+        check_ddl = """
+          ALTER TABLE "HR"."JOBS" ADD CHECK (kind IN ('DATE','RAW','NUMBER')) ENABLE;
+        """
+        
+        table = self.converter.convert_ddl(table_ddl, 'HR')
+        check = self.converter.convert_ddl(check_ddl, 'HR')
+        
+        assert "kind VARCHAR(10) DEFAULT 'LONG'" in table
+        assert "note VARCHAR(30) DEFAULT 'it''s a DATE'" in table
+        assert check == "ALTER TABLE jobs ADD CHECK (kind IN ('DATE','RAW','NUMBER'));"
+    
+    def test_convert_ddl_keeps_identifiers_quoted_when_needed(self):
+        """Test identifiers with '#' or matching keywords stay quoted"""
+        oracle_ddl = 'CREATE TABLE "EMP#" ("EMP#" NUMBER, "LEFT" NUMBER, "IS" DATE, "ID" NUMBER)'
+        
+        result = self.converter.convert_ddl(oracle_ddl)
+        
+        assert result == (
+            'CREATE TABLE "emp#" ("emp#" NUMERIC, "left" NUMERIC, "is" TIMESTAMP, id NUMERIC);'
+        )
+    
+    def test_convert_constraint_ddl(self):
+        """Test constraint state clauses are removed"""
+        oracle_ddl = """
+          ALTER TABLE "HR"."EMP" ADD CONSTRAINT "EMP_FK" FOREIGN KEY ("DEPT_ID")
+        	  REFERENCES "HR"."DEPT" ("ID") ENABLE NOVALIDATE;
+        """
+        
+        result = self.converter.convert_ddl(oracle_ddl, 'HR')
+        
+        assert 'REFERENCES dept (id) NOT VALID;' in result
+        assert 'ENABLE' not in result
+    
+    def test_convert_ddl_clauses_only_outside_expressions(self):
+        """Test clause keywords in CHECK conditions and view queries are kept"""
+        check_ddl = """
+          ALTER TABLE "HR"."CFG" ADD CONSTRAINT "CFG_CK" CHECK (enable IN (0, 1)) ENABLE;
+        """
+        view_ddl = """
+          CREATE OR REPLACE FORCE EDITIONABLE VIEW "HR"."V" ("ID", "LOGGING") AS
+          SELECT id, logging FROM audit_cfg WHERE enable = 1
+        """
+        
+        check = self.converter.convert_ddl(check_ddl, 'HR')
+        view = self.converter.convert_ddl(view_ddl, 'HR')
+        
+        assert check == 'ALTER TABLE cfg ADD CONSTRAINT cfg_ck CHECK (enable IN (0, 1));'
+        assert view.endswith('SELECT id, logging FROM audit_cfg WHERE enable = 1;')
+    
+    def test_convert_ddl_warns_on_oracle_only_forms(self):
+        """Test bitmap indexes, read only views and ROWNUM are reported"""
+        index = self.converter.convert_ddl('CREATE BITMAP INDEX "HR"."I" ON "HR"."T" ("S");', 'HR')
+        view = self.converter.convert_ddl(
+            'CREATE OR REPLACE VIEW "HR"."V" ("ID") AS SELECT id FROM t WHERE ROWNUM = 1 '
+            'WITH READ ONLY;', 'HR'
+        )
+        warnings = [line for line in self.converter.get_conversion_log()
+                    if line.startswith('WARNING')]
+        
+        assert index == 'CREATE INDEX i ON t (s);'
+        assert 'READ ONLY' not in view
+        assert len(warnings) == 3
+    
+    def test_convert_sequence_ddl(self):
+        """Test CREATE SEQUENCE option conversion"""
+        oracle_ddl = """
+           CREATE SEQUENCE  "HR"."EMP_SEQ"  MINVALUE 1 MAXVALUE 9999999999999999999999999999
+           INCREMENT BY 1 START WITH 21 CACHE 20 NOORDER  NOCYCLE  NOKEEP  NOSCALE  GLOBAL ;
+        """
+        
+        result = self.converter.convert_ddl(oracle_ddl, 'HR')
+        
+        assert 'CREATE SEQUENCE  emp_seq' in result
+        assert 'MAXVALUE' not in result
+        assert 'NO CYCLE' in result
+        assert 'START WITH 21 CACHE 20' in result
+        for option in ('NOORDER', 'NOKEEP', 'NOSCALE', 'GLOBAL'):
+            assert option not in result
+    
+    def test_convert_view_ddl(self):
+        """Test view DDL conversion"""
+        oracle_ddl = """
+          CREATE OR REPLACE FORCE EDITIONABLE VIEW "HR"."EMP_V" ("ID", "NAME") AS
+          SELECT id, NVL(name, 'n/a') FROM hr.employees
+        """
+        
+        result = self.converter.convert_ddl(oracle_ddl, 'HR')
+        
+        assert result.startswith('CREATE OR REPLACE VIEW emp_v (id, name) AS')
+        assert "COALESCE(name, 'n/a') FROM employees;" in result
+
 
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
@@ -0,0 +1,76 @@
+"""
+Test suite for deduplication of identical objects across schemas
+"""
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dedup import (
+    strip_owner, normalize_source, source_hash, group_duplicates, owner_template, fill_owner
+)
+
+
+class TestDedup:
+
+    def test_strip_owner(self):
+        """Test removing owner qualifiers"""
+        source = 'SELECT * FROM tenant1.orders o JOIN "TENANT1"."ITEMS" i'
+
+        result = strip_owner(source, 'TENANT1')
+
+        assert 'tenant1' not in result.lower()
+        assert 'FROM orders' in result
+        assert '"ITEMS"' in result
+
+    def test_owner_template(self):
+        """Test a template qualifies the object and its references per owner"""
+        source = 'PROCEDURE p AS BEGIN DELETE FROM tenant1.t; DELETE FROM "TENANT1".u; END;'
+
+        template = owner_template(source, 'TENANT1')
+
+        assert fill_owner(template, 'TENANT2') == (
+            'PROCEDURE TENANT2.p AS BEGIN DELETE FROM TENANT2.t; DELETE FROM TENANT2.u; END;'
+        )
+
+    def test_normalize_whitespace_and_case(self):
+        """Test whitespace and case normalization"""
+        a = "procedure p as\nbegin\n    null;\nend;"
+        b = "PROCEDURE P AS BEGIN NULL; END;"
+
+        assert normalize_source(a) == normalize_source(b)
+
+    def test_normalize_keeps_literals(self):
+        """Test string literals are not normalized"""
+        a = "BEGIN v := 'abc'; END;"
+        b = "BEGIN v := 'ABC'; END;"
+
+        assert normalize_source(a) != normalize_source(b)
+        assert "'abc'" in normalize_source(a)
+
+    def test_hash_ignores_owner(self):
+        """Test identical bodies in different schemas hash the same"""
+        a = "PROCEDURE p AS BEGIN DELETE FROM tenant1.t; END;"
+        b = "PROCEDURE p AS BEGIN DELETE FROM tenant2.t; END;"
+
+        assert source_hash(a, 'TENANT1') == source_hash(b, 'TENANT2')
+        assert source_hash(a, 'TENANT1') != source_hash(b, 'TENANT1')
+
+    def test_group_duplicates(self):
+        """Test grouping objects by normalized body"""
+        objects = [
+            {'OWNER': 'T1', 'OBJECT_NAME': 'P', 'SOURCE': 'PROCEDURE p AS BEGIN NULL; END;'},
+            {'OWNER': 'T2', 'OBJECT_NAME': 'P', 'SOURCE': 'procedure p as begin null; end;'},
+            {'OWNER': 'T3', 'OBJECT_NAME': 'P', 'SOURCE': 'PROCEDURE p AS BEGIN COMMIT; END;'},
+        ]
+
+        groups = group_duplicates(objects)
+
+        assert len(groups) == 2
+        assert sorted(len(members) for members in groups.values()) == [1, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,92 @@
+"""
+Test suite for the Oracle vs PostgreSQL equivalence harness
+"""
+import pytest
+import sys
+import os
+from datetime import date, datetime
+from decimal import Decimal
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from equivalence import (
+    generate_inputs, coerce_inputs, normalize_value, compare_results, argument_category,
+    pg_argument_types, is_equivalent, format_equivalence_report
+)
+
+ARGUMENTS = [{'DATA_TYPE': 'NUMBER'}, {'DATA_TYPE': 'VARCHAR2'}, {'DATA_TYPE': 'DATE'}]
+
+
+class TestEquivalence:
+
+    def test_generate_inputs(self):
+        """Test generated inputs match the argument types"""
+        inputs = generate_inputs(ARGUMENTS, count=200, seed=1)
+
+        assert len(inputs) == 200
+        assert all(len(row) == 3 for row in inputs)
+        assert (None, None, None) in inputs
+        assert inputs == generate_inputs(ARGUMENTS, count=200, seed=1)
+
+    def test_generate_inputs_without_arguments(self):
+        """Test a function without arguments is called once"""
+        assert generate_inputs([], count=100) == [()]
+
+    def test_coerce_inputs(self):
+        """Test parameter set values are converted to the argument types"""
+        rows = coerce_inputs([[1.5, 'x', '2024-01-31']], ARGUMENTS)
+
+        assert rows == [(Decimal('1.5'), 'x', datetime(2024, 1, 31))]
+
+        with pytest.raises(ValueError):
+            coerce_inputs([[1]], ARGUMENTS)
+
+    def test_normalize_value(self):
+        """Test values of both drivers compare equal"""
+        assert normalize_value('') is None
+        assert normalize_value(Decimal('1.50')) == normalize_value(1.5)
+        assert normalize_value(10) == normalize_value(Decimal('10'))
+        assert normalize_value(date(2024, 1, 1)) == normalize_value(datetime(2024, 1, 1))
+
+    def test_compare_results(self):
+        """Test matches, mismatches and errors on both sides"""
+        inputs = [(1,), (2,), (3,)]
+        oracle = [(True, Decimal('2')), (True, 'a'), (False, 'ORA-01403')]
+        pg = [(True, 2), (True, 'b'), (False, 'no data')]
+
+        summary = compare_results(inputs, oracle, pg)
+
+        assert summary['matches'] == 1
+        assert summary['mismatches'] == 1
+        assert summary['both_errors'] == 1
+        assert summary['examples'][0]['args'] == (2,)
+
+    def test_failing_everywhere_is_not_equivalent(self):
+        """Test a function failing on both sides for every input does not pass"""
+        summary = compare_results([(1,), (2,)], [(False, 'ORA-06553')] * 2,
+                                  [(False, 'does not exist')] * 2)
+
+        report = format_equivalence_report({'F': summary})
+
+        assert not is_equivalent(summary)
+        assert report[1].startswith('✗ F')
+        assert report[-1].endswith('0/1 functions equivalent')
+
+    def test_argument_category(self):
+        """Test Oracle argument type categories"""
+        assert argument_category('PLS_INTEGER') == 'integer'
+        assert argument_category('VARCHAR2') == 'string'
+        assert argument_category('REF CURSOR') is None
+
+    def test_pg_argument_types(self):
+        """Test CHAR arguments are not cast to char(1)"""
+        arguments = ARGUMENTS + [{'DATA_TYPE': 'CHAR'}, {'DATA_TYPE': 'NCHAR'}]
+
+        assert pg_argument_types(arguments) == [
+            'numeric', 'varchar', 'timestamp', 'varchar', 'varchar'
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,153 @@
+"""
+Test suite for the local fake Oracle catalog
+"""
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fake_oracle import FakeOracleConnector
+from main import extract_and_convert
+
+
+class TestFakeOracle:
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.oracle = FakeOracleConnector()
+
+    def test_load_examples(self):
+        """Test loading the example SQL files"""
+        names = self.oracle.load_examples()
+        self.oracle.connect()
+
+        procedures = self.oracle.get_procedures('EXAMPLES')
+        source = self.oracle.get_procedure_source('GET_EMPLOYEE_FULLNAME', 'EXAMPLES')
+
+        assert 'GET_EMPLOYEE_FULLNAME' in names
+        assert {proc['OBJECT_NAME'] for proc in procedures} == set(names)
+        assert source.startswith('FUNCTION get_employee_fullname')
+        assert 'END get_employee_fullname;' in source
+
+    def test_dependencies(self):
+        """Test table references are recorded as dependencies"""
+        self.oracle.load_examples()
+        self.oracle.connect()
+
+        rows = self.oracle.execute_query(
+            "SELECT referenced_name FROM all_dependencies WHERE name = :name",
+            {'name': 'GET_EMPLOYEE_FULLNAME'}
+        )
+
+        assert rows == [{'REFERENCED_NAME': 'EMPLOYEES'}]
+
+    def test_generate_and_batch_fetch(self):
+        """Test synthetic schemas and batched source fetching"""
+        self.oracle.generate(schemas=3, objects_per_schema=4)
+        self.oracle.connect()
+
+        procedures = self.oracle.get_procedures()
+        sources = self.oracle.get_procedure_sources(names=['PROC_00000', 'PROC_00001'])
+
+        assert len(procedures) == 12
+        assert len(sources) == 6
+        assert 'TENANT_0002.audit_log' in sources[('TENANT_0002', 'PROC_00001')]
+
+    def test_round_trips(self):
+        """Test round trips are counted per execute and fetch batch"""
+        self.oracle.generate(schemas=1, objects_per_schema=3)
+        self.oracle.connect()
+        before = self.oracle.round_trips
+
+        self.oracle.get_procedures()
+
+        assert self.oracle.round_trips == before + 2
+
+    def test_fetch_more_than_1000_names(self):
+        """Test long name lists are split into IN lists of 1000"""
+        self.oracle.generate(schemas=1, objects_per_schema=1200)
+        self.oracle.connect()
+        names = [f"PROC_{index:05d}" for index in range(1200)]
+        queries = []
+        execute = self.oracle.cursor.execute
+
+        def record(query, params=None, **kwargs):
+            queries.append(query)
+            return execute(query, params, **kwargs)
+
+        self.oracle.cursor.execute = record
+
+        sources = self.oracle.get_procedure_sources(names=names)
+
+        assert len(sources) == 1200
+        assert len(queries) == 2
+
+    def test_resume_redoes_changed_source(self, tmp_path):
+        """Test resume skips unchanged objects and redoes changed ones"""
+        self.oracle.generate(schemas=1, objects_per_schema=3)
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle)
+
+        # Whitespace-only change of one object
+        self.oracle.catalog.execute(
+            "UPDATE all_source SET text = REPLACE(text, ' ', '  ') "
+            "WHERE name = 'PROC_00001' AND line = 1"
+        )
+        self.oracle.catalog.execute(
+            "UPDATE all_objects SET last_ddl_time = '2099-01-01 00:00:00' "
+            "WHERE object_name = 'PROC_00001'"
+        )
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle, resume=True)
+
+        with open(tmp_path / 'PROC_00001_oracle.sql') as f:
+            assert f.read().startswith('PROCEDURE  PROC_00001')
+
+    def test_resume_skips_fetch_of_unchanged_objects(self, tmp_path):
+        """Test resume fetches no source when nothing was redefined"""
+        self.oracle.generate(schemas=2, objects_per_schema=3)
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle)
+
+        queries = []
+        get_procedure_sources = self.oracle.get_procedure_sources
+
+        def record(*args, **kwargs):
+            queries.append(args)
+            return get_procedure_sources(*args, **kwargs)
+
+        self.oracle.get_procedure_sources = record
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle, resume=True)
+        extract_and_convert(output_dir=str(tmp_path), dedup=True, oracle=self.oracle,
+                            resume=True)
+
+        assert queries == []
+
+    def test_failed_listing_keeps_manifest(self, tmp_path):
+        """Test a run that processes nothing does not overwrite the manifest"""
+        self.oracle.generate(schemas=1, objects_per_schema=2)
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle)
+        with open(tmp_path / 'manifest.json') as f:
+            before = f.read()
+
+        self.oracle.get_procedures = lambda owner=None: None
+        extract_and_convert(output_dir=str(tmp_path), oracle=self.oracle)
+
+        with open(tmp_path / 'manifest.json') as f:
+            assert f.read() == before
+
+    def test_dedup_keeps_each_schema(self, tmp_path):
+        """Test copies of a deduplicated body reference their own schema"""
+        self.oracle.generate(schemas=2, objects_per_schema=1)
+        extract_and_convert(output_dir=str(tmp_path), dedup=True, oracle=self.oracle)
+
+        for owner, other in (('TENANT_0000', 'TENANT_0001'), ('TENANT_0001', 'TENANT_0000')):
+            with open(tmp_path / owner / 'PROC_00000_postgresql.sql') as f:
+                code = f.read()
+            assert f'PROCEDURE {owner}.PROC_00000' in code
+            assert f'FROM {owner}.table_0' in code
+            assert f"NEXTVAL('{owner}.audit_seq')" in code
+            assert other not in code
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
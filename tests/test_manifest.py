@@ -0,0 +1,69 @@
+"""
+Test suite for the resumable run manifest
+"""
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from manifest import RunManifest, batches, raw_source_hash
+
+
+class TestManifest:
+
+    def test_save_and_load(self, tmp_path):
+        """Test a saved manifest is loaded back"""
+        path = str(tmp_path / 'manifest.json')
+        manifest = RunManifest(path)
+        manifest.record_done('HR.P1', 'abc')
+        manifest.record_failed('HR.P2', 'source not found')
+        manifest.save()
+
+        loaded = RunManifest.load(path)
+
+        assert loaded.is_done('HR.P1', 'abc')
+        assert not loaded.is_done('HR.P2', None)
+        assert list(loaded.failures()) == ['HR.P2']
+        assert not os.path.exists(path + '.tmp')
+
+    def test_changed_source_is_not_done(self, tmp_path):
+        """Test an object is redone when its source hash changes"""
+        manifest = RunManifest(str(tmp_path / 'manifest.json'))
+        manifest.record_done('HR.P1', 'abc')
+
+        assert not manifest.is_done('HR.P1', 'def')
+
+    def test_unchanged_ddl_time(self, tmp_path):
+        """Test objects are skipped by LAST_DDL_TIME without their source"""
+        manifest = RunManifest(str(tmp_path / 'manifest.json'))
+        manifest.record_done('HR.P1', 'abc', '2024-01-01 10:00:00')
+        manifest.record_done('HR.P2', 'def')
+
+        assert manifest.is_unchanged('HR.P1', '2024-01-01 10:00:00')
+        assert not manifest.is_unchanged('HR.P1', '2024-01-02 10:00:00')
+        assert not manifest.is_unchanged('HR.P2', None)
+        assert manifest.changed
+
+    def test_load_missing_file(self, tmp_path):
+        """Test loading a manifest that does not exist yet"""
+        manifest = RunManifest.load(str(tmp_path / 'missing.json'))
+
+        assert manifest.objects == {}
+
+    def test_raw_source_hash(self):
+        """Test whitespace and case changes give a different hash"""
+        source = "PROCEDURE p AS BEGIN NULL; END;"
+
+        assert raw_source_hash(source) == raw_source_hash(source)
+        assert raw_source_hash(source) != raw_source_hash(source.lower())
+        assert raw_source_hash(source) != raw_source_hash(source.replace(' ', '  '))
+
+    def test_batches(self):
+        """Test splitting into batches"""
+        assert list(batches([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
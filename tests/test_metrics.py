@@ -0,0 +1,90 @@
+"""
+Test suite for migration progress metrics
+"""
+import pytest
+import sys
+import os
+import json
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from metrics import MigrationMetrics
+
+
+class TestMetrics:
+
+    def test_nested_phases_are_exclusive(self):
+        """Test nested phase time is not counted twice"""
+        metrics = MigrationMetrics()
+
+        with metrics.time('convert'):
+            with metrics.time('format'):
+                pass
+
+        assert metrics.histograms['convert'].count == 1
+        assert metrics.histograms['format'].count == 1
+        total = metrics.histograms['convert'].sum + metrics.histograms['format'].sum
+        assert total <= metrics.elapsed()
+
+    def test_progress_and_counters(self):
+        """Test counters and progress line"""
+        metrics = MigrationMetrics(total=4)
+
+        metrics.unit_done(show_progress=False)
+        metrics.unit_done(failed=True, show_progress=False)
+
+        assert metrics.completed == 2
+        assert '[2/4] 50.0%' in metrics.progress_line()
+        assert '1 failed' in metrics.progress_line()
+
+    def test_prometheus_output(self):
+        """Test Prometheus text format"""
+        metrics = MigrationMetrics(total=1)
+        metrics.observe('fetch', 0.002)
+        metrics.unit_done(show_progress=False)
+
+        text = metrics.to_prometheus()
+
+        assert 'oracle_convert_done_total 1' in text
+        assert 'oracle_convert_phase_seconds_bucket{phase="fetch",le="0.005"} 1' in text
+        assert 'oracle_convert_phase_seconds_count{phase="fetch"} 1' in text
+
+    def test_write_json_snapshot(self, tmp_path):
+        """Test writing a JSON snapshot"""
+        path = str(tmp_path / 'metrics.json')
+        metrics = MigrationMetrics(total=1, snapshot_file=path)
+        metrics.unit_done(show_progress=False)
+
+        metrics.write_snapshot()
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data['completed'] == 1
+        assert not os.path.exists(path + '.tmp')
+
+
+    def test_snapshots_during_long_phase(self, tmp_path):
+        """Test the snapshot thread writes while a phase is still running"""
+        path = str(tmp_path / 'metrics.json')
+        metrics = MigrationMetrics(snapshot_file=path, snapshot_interval=0.01)
+
+        metrics.start()
+        try:
+            with metrics.time('fetch'):
+                deadline = time.monotonic() + 2
+                while not os.path.exists(path) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                with open(path) as f:
+                    data = json.load(f)
+                text = metrics.to_prometheus()
+        finally:
+            metrics.stop()
+
+        assert 'fetch' in data['phases_in_progress']
+        assert 'oracle_convert_phase_in_progress_seconds{phase="fetch"}' in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
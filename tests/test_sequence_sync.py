@@ -0,0 +1,85 @@
+"""
+Test suite for sequence synchronization
+"""
+import pytest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from sequence_sync import plan_sequence_sync, format_sync_report
+
+
+def oracle_row(name, last_number, increment_by=1, owner='HR'):
+    return {'SEQUENCE_OWNER': owner, 'SEQUENCE_NAME': name,
+            'LAST_NUMBER': last_number, 'INCREMENT_BY': increment_by}
+
+
+def pg_row(name, last_value, increment_by=1, is_called=True, schema='hr',
+           min_value=-2 ** 63, max_value=2 ** 63 - 1):
+    return {'schemaname': schema, 'sequencename': name, 'min_value': min_value,
+            'max_value': max_value, 'increment_by': increment_by,
+            'last_value': last_value, 'is_called': is_called}
+
+
+class TestSequenceSync:
+
+    def test_advance_lagging_sequence(self):
+        """Test a sequence behind Oracle is advanced"""
+        plan = plan_sequence_sync([oracle_row('EMP_SEQ', 1021)], [pg_row('emp_seq', 1, is_called=False)])
+
+        assert plan[0]['name'] == '"hr"."emp_seq"'
+        assert plan[0]['action'] == 'advance'
+        assert plan[0]['pg_next'] == 1
+        assert plan[0]['drift'] == 1020
+
+    def test_sequence_in_sync(self):
+        """Test a sequence already at Oracle's value is left alone"""
+        plan = plan_sequence_sync([oracle_row('EMP_SEQ', 21)], [pg_row('emp_seq', 20)])
+
+        assert plan[0]['action'] == 'ok'
+        assert plan[0]['drift'] == 0
+
+    def test_sequence_never_moves_backwards(self):
+        """Test a sequence ahead of Oracle is reported, not changed"""
+        plan = plan_sequence_sync([oracle_row('EMP_SEQ', 21)], [pg_row('emp_seq', 500)])
+
+        assert plan[0]['action'] == 'ahead'
+
+    def test_sequence_set_but_not_called(self):
+        """Test a sequence left by setval(n, false) continues at n"""
+        plan = plan_sequence_sync([oracle_row('EMP_SEQ', 1021), oracle_row('DEPT_SEQ', 1021)],
+                                  [pg_row('emp_seq', 1021, is_called=False),
+                                   pg_row('dept_seq', 5000, is_called=False)])
+
+        assert [entry['pg_next'] for entry in plan] == [1021, 5000]
+        assert [entry['action'] for entry in plan] == ['ok', 'ahead']
+
+    def test_target_outside_sequence_range(self):
+        """Test a value beyond MAXVALUE is reported instead of set"""
+        plan = plan_sequence_sync([oracle_row('SMALL_SEQ', 40000)],
+                                  [pg_row('small_seq', 10, max_value=32767)])
+
+        assert plan[0]['action'] == 'out_of_range'
+        assert any('MAXVALUE 32767' in line for line in format_sync_report(plan))
+
+    def test_descending_sequence(self):
+        """Test drift of a descending sequence"""
+        plan = plan_sequence_sync([oracle_row('DOWN_SEQ', -50, -1)],
+                                  [pg_row('down_seq', -10, -1)])
+
+        assert plan[0]['action'] == 'advance'
+        assert plan[0]['drift'] == 39
+
+    def test_missing_sequence_and_schema_override(self):
+        """Test missing sequences and an explicit PostgreSQL schema"""
+        plan = plan_sequence_sync([oracle_row('A_SEQ', 5), oracle_row('B_SEQ', 5)],
+                                  [pg_row('a_seq', 4, schema='public')], pg_schema='public')
+
+        assert [entry['action'] for entry in plan] == ['ok', 'missing']
+        assert any('not found' in line for line in format_sync_report(plan))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])